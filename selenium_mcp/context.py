@@ -1,15 +1,26 @@
 """Context management for Selenium MCP server."""
 
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional, Callable, Awaitable
-from dataclasses import dataclass
+import time
+from typing import Any, Dict, List, Optional, Callable, Awaitable, Sequence
+from dataclasses import dataclass, field
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.support.ui import WebDriverWait
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on recorded actions kept for script generation (later actions are refused)
+MAX_RECORDED_ACTIONS = 10000
+
+# Timeout (seconds) of the shared WebDriverWait handed out by Context.driver_wait
+DEFAULT_WAIT_TIMEOUT = 10
+
 @dataclass
 class ToolResult:
     """Result from tool execution."""
-    code: List[str]
+    code: Sequence[str]
     action: Optional[Callable[[], Awaitable[Any]]] = None
     capture_snapshot: bool = True
     wait_for_network: bool = False
@@ -24,6 +35,8 @@ class ElementInfo:
     is_clickable: bool = False
     css_classes: List[str] = None
     attributes: Dict[str, str] = None
+    # WebElement found while capturing; saves interaction tools a find_element
+    web_element: Any = field(default=None, repr=False, compare=False)
     
     def __post_init__(self):
         if self.css_classes is None:
@@ -37,9 +50,41 @@ class PageSnapshot:
     elements: Dict[str, ElementInfo]
     url: str = ""
     title: str = ""
+    # ref -> (by, locator); lives and dies with this snapshot
+    _locator_cache: Dict[str, tuple] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # Rendered capture_page YAML, filled in by SnapshotTool on first use
+    yaml_cache: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     def ref_locator(self, ref: str):
         """Get locator for element reference - playwright-mcp style."""
+        locator = self._locator_cache.get(ref)
+        if locator is None:
+            locator = self._locator_cache[ref] = self._build_ref_locator(ref)
+        return locator
+    
+    def prime_locators(self):
+        """Build every element's locator up front so interactions only do a dict lookup."""
+        cache = self._locator_cache
+        for ref in self.elements:
+            if ref not in cache:
+                cache[ref] = self._build_ref_locator(ref)
+    
+    def with_element(self, driver, ref: str, use: Callable[[Any], Any]):
+        """Call use(element) with the WebElement captured for ref.
+        
+        Falls back to finding the element by its locator when none was
+        captured or the captured one has gone stale.
+        """
+        info = self.elements.get(ref)
+        if info is not None and info.web_element is not None:
+            try:
+                return use(info.web_element)
+            except StaleElementReferenceException:
+                logger.debug(f"Captured element for {ref} is stale, finding it again")
+        return use(driver.find_element(*self.ref_locator(ref)))
+    
+    def _build_ref_locator(self, ref: str):
+        """Build the locator for an element reference."""
         from selenium.webdriver.common.by import By
         
         # For playwright-mcp style refs (e1, e2, e3...), we need to find the element
@@ -126,6 +171,9 @@ class BrowserManager:
                 logger.info("🔄 Trying alternative browser initialization...")
                 self.driver = webdriver.Chrome(options=options)
                 logger.info("🌐 Browser initialized (alternative method)")
+            
+            # Set page load timeout once to prevent navigation from hanging
+            self.driver.set_page_load_timeout(30)
         
         return self.driver
     
@@ -144,9 +192,16 @@ class Context:
         self.browser_manager = BrowserManager()
         self.current_snapshot: Optional[PageSnapshot] = None
         self.action_history: List[Dict[str, Any]] = []  # Track recorded actions
+        self.history_version: int = 0  # Bumped on every recorded action; lets generators cache output
         self.recording_enabled: bool = False  # Control recording state
         self.planning_session: Optional[Dict[str, Any]] = None  # Track planning sessions
         self.generation_session: Optional[Dict[str, Any]] = None  # Track generation sessions
+        self._action_chains: Optional[ActionChains] = None  # Reused across input tools
+        self._action_chains_driver = None  # Driver the cached ActionChains was built for
+        self._driver_wait: Optional[WebDriverWait] = None  # Reused across verification tools
+        self._driver_wait_driver = None  # Driver the cached WebDriverWait was built for
+        self.cdp_network_driver = None  # Driver that already has the CDP Network domain enabled
+        self.tool_lock = asyncio.Lock()  # Serializes tool runs; a WebDriver session takes one command at a time
     
     async def ensure_browser(self):
         """Ensure browser is available."""
@@ -222,13 +277,19 @@ class Context:
                             "id": element.get_attribute("id") or "",
                             "role": element.get_attribute("role") or "",
                             "type": element.get_attribute("type") or ""
-                        }
+                        },
+                        web_element=element
                     )
                     elements[ref] = element_info
                 except:
                     continue
             
-            self.current_snapshot = PageSnapshot(elements=elements, url=url, title=title)
+            snapshot = PageSnapshot(elements=elements, url=url, title=title)
+            # An unchanged page keeps its previous snapshot, and with it the
+            # locator and YAML caches; any DOM/URL/title change replaces it
+            if snapshot != self.current_snapshot:
+                snapshot.prime_locators()
+                self.current_snapshot = snapshot
             
         except Exception as e:
             logger.error(f"❌ Snapshot capture failed: {e}")
@@ -240,6 +301,22 @@ class Context:
             raise RuntimeError("No browser session active")
         return self.browser_manager.driver
     
+    def action_chains(self, driver) -> ActionChains:
+        """Get a reusable ActionChains bound to driver with no queued actions."""
+        # Chains are only built and performed in one go, and perform() empties the
+        # queues before sending them, so a cached chain never carries leftovers
+        if self._action_chains is None or self._action_chains_driver is not driver:
+            self._action_chains = ActionChains(driver)
+            self._action_chains_driver = driver
+        return self._action_chains
+    
+    def driver_wait(self, driver) -> WebDriverWait:
+        """Get a reusable WebDriverWait bound to driver with DEFAULT_WAIT_TIMEOUT."""
+        if self._driver_wait is None or self._driver_wait_driver is not driver:
+            self._driver_wait = WebDriverWait(driver, DEFAULT_WAIT_TIMEOUT)
+            self._driver_wait_driver = driver
+        return self._driver_wait
+    
     def snapshot_or_die(self):
         """Get current snapshot or raise error."""
         if not self.current_snapshot:
@@ -249,34 +326,50 @@ class Context:
     def record_action(self, tool_name: str, params: Dict[str, Any]):
         """Record an action for script generation."""
         if self.recording_enabled:
+            if len(self.action_history) >= MAX_RECORDED_ACTIONS:
+                # Keep the start of the flow intact rather than silently dropping it
+                logger.warning(
+                    "Recording limit of %s actions reached, not recording %s",
+                    MAX_RECORDED_ACTIONS, tool_name
+                )
+                return
             action = {
                 "tool": tool_name,
                 "params": params,
-                "timestamp": __import__('time').time()
+                "timestamp": time.time()
             }
             self.action_history.append(action)
+            self.history_version += 1
             logger.info(f"📹 Recorded action: {tool_name}")
 
-    async def run_tool(self, tool, arguments: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute a tool with given arguments."""
+    async def run_tool(self, tool, arguments: Dict[str, Any], params: Optional[Any] = None) -> Dict[str, Any]:
+        """Execute a tool with given arguments.
+        
+        Pass `params` when the arguments were already validated into the tool's
+        input schema (e.g. by FastMCP) to skip validating them a second time.
+        """
         try:
-            # Validate and parse parameters
-            params = tool.schema.validate_params(arguments)
+            # Validate and parse parameters unless already validated by the caller
+            if not isinstance(params, tool.schema.input_schema):
+                params = tool.schema.validate_params(arguments)
             
             # Record the action if recording is enabled
             self.record_action(tool.schema.name, arguments)
             
-            # Execute the tool
-            result = await tool.handle(self, params)
+            # Execute the tool, its action and the follow-up snapshot without
+            # interleaving WebDriver commands from concurrent tool calls
+            async with self.tool_lock:
+                result = await tool.handle(self, params)
+                
+                # Execute the action if present
+                if result.action:
+                    action_result = await result.action()
+                    
+                    # Capture snapshot after action if requested (like playwright-mcp)
+                    if result.capture_snapshot:
+                        await self.capture_snapshot()
             
-            # Execute the action if present
             if result.action:
-                action_result = await result.action()
-                
-                # Capture snapshot after action if requested (like playwright-mcp)
-                if result.capture_snapshot:
-                    await self.capture_snapshot()
-                
                 # Build response with automatic snapshot inclusion (like playwright-mcp)
                 response_lines = []
                 
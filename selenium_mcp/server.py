@@ -1,8 +1,11 @@
 #!/usr/bin/env python3
 """Selenium MCP Server - FastMCP 2.0 implementation for browser automation."""
 
+import atexit
 import logging
+import logging.handlers
 import sys
+import threading
 from pathlib import Path
 from typing import Any
 
@@ -18,15 +21,67 @@ from selenium_mcp.tools import get_all_tools
 
 # Configure logging to file only (not stdout/stderr which interferes with MCP)
 log_file = Path(__file__).parent / "mcp_server.log"
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_file, encoding='utf-8'),
-    ]
+LOG_BUFFER_CAPACITY = 512
+LOG_FLUSH_INTERVAL = 0.1
+
+file_handler = logging.FileHandler(log_file, encoding='utf-8')
+file_handler.setFormatter(
+    logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+)
+
+# Buffer records and write them in batches; warnings and errors flush immediately
+log_buffer = logging.handlers.MemoryHandler(
+    capacity=LOG_BUFFER_CAPACITY,
+    flushLevel=logging.WARNING,
+    target=file_handler
 )
+logging.basicConfig(level=logging.INFO, handlers=[log_buffer])
 logger = logging.getLogger(__name__)
 
+log_flush_stop = threading.Event()
+
+def _flush_log_buffer():
+    """Periodically flush buffered log records so the file never lags far behind."""
+    while not log_flush_stop.wait(LOG_FLUSH_INTERVAL):
+        log_buffer.flush()
+    log_buffer.flush()
+
+def start_log_flusher():
+    """Start the periodic log flush thread; it is stopped and drained at exit."""
+    flusher = threading.Thread(target=_flush_log_buffer, name="log-flush", daemon=True)
+    flusher.start()
+    
+    def stop_log_flusher():
+        log_flush_stop.set()
+        flusher.join()
+    
+    atexit.register(stop_log_flusher)
+
+def install_fast_json_encoder() -> bool:
+    """Encode WebDriver command bodies with orjson when it is installed.
+    
+    Only Selenium's own ``dump_json`` helper is replaced; the stdlib ``json``
+    module is left untouched. Payloads orjson rejects fall back to ``json``.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return False
+    
+    from selenium.webdriver.remote import utils
+    
+    stdlib_dump_json = utils.dump_json
+    
+    def dump_json(json_struct: Any) -> str:
+        try:
+            return orjson.dumps(json_struct).decode()
+        except TypeError:
+            return stdlib_dump_json(json_struct)
+    
+    utils.dump_json = dump_json
+    logger.debug("Using orjson for WebDriver command encoding")
+    return True
+
 # Initialize FastMCP server
 mcp = FastMCP("selenium-mcp")
 
@@ -70,8 +125,8 @@ for tool in tools:
                 # Convert Pydantic model to dict for our tool execution
                 arguments = params.model_dump() if hasattr(params, 'model_dump') else params.dict()
 
-                # Execute the tool
-                result = await ctx.run_tool(tool_obj, arguments)
+                # Execute the tool (params were already validated by FastMCP)
+                result = await ctx.run_tool(tool_obj, arguments, params=params)
 
                 # Return result as text
                 return result.get("text", str(result))
@@ -99,6 +154,10 @@ logger.info(f"Selenium MCP Server initialized with {len(tools)} tools")
 
 def main():
     """Main entry point for the Selenium MCP server."""
+    start_log_flusher()
+    # Encode CDP/WebDriver command bodies with orjson when available
+    install_fast_json_encoder()
+    
     # Run the FastMCP server
     mcp.run()
 
@@ -1,15 +1,23 @@
 """Base classes for tools - matches playwright-mcp tool structure."""
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Awaitable, Callable, ClassVar, Dict, List, Optional, Type
 from dataclasses import dataclass
+from functools import cached_property
 from pydantic import BaseModel, ValidationError
 
 from .context import Context, ToolResult
 
 logger = logging.getLogger(__name__)
 
+def run_in_thread(func: Callable[[], Any]) -> Callable[[], Awaitable[Any]]:
+    """Wrap a blocking WebDriver action so it runs in a worker thread, off the event loop."""
+    async def action():
+        return await asyncio.to_thread(func)
+    return action
+
 @dataclass
 class ToolSchema:
     """Tool schema definition - matches playwright-mcp ToolSchema."""
@@ -18,9 +26,9 @@ class ToolSchema:
     input_schema: Type[BaseModel]
     tool_type: str = "readOnly"  # or "destructive"
     
-    @property
+    @cached_property
     def input_schema_dict(self) -> Dict[str, Any]:
-        """Get input schema as dictionary for MCP."""
+        """Get input schema as dictionary for MCP (generated once per schema)."""
         try:
             return self.input_schema.model_json_schema()
         except AttributeError:
@@ -41,8 +49,14 @@ class ToolSchema:
 class BaseTool(ABC):
     """Base class for all tools - matches playwright-mcp Tool interface."""
     
+    _schema_cache: ClassVar[Dict[type, ToolSchema]] = {}  # Schemas are static, built once per tool class
+    
     def __init__(self):
-        self.schema = self._create_schema()
+        cls = type(self)
+        schema = BaseTool._schema_cache.get(cls)
+        if schema is None:
+            schema = BaseTool._schema_cache[cls] = self._create_schema()
+        self.schema = schema
     
     @abstractmethod
     def _create_schema(self) -> ToolSchema:
@@ -1011,7 +1011,7 @@ class GeneratorSetupTool(BaseTool):
 
             # Enable recording to track actions
             context.recording_enabled = True
-            context.action_history = []
+            context.action_history.clear()
 
             # Capture initial snapshot
             await context.capture_snapshot()
@@ -1194,7 +1194,7 @@ class GeneratorWriteTestTool(BaseTool):
 
             # Clear action history after generating
             if context.recording_enabled:
-                context.action_history = []
+                context.action_history.clear()
 
             logger.info(f"✅ Test code saved to: {test_path}")
 
@@ -8,6 +8,12 @@ from ..context import Context
 
 logger = logging.getLogger(__name__)
 
+# Robot Framework code (static)
+CLOSE_CODE = (
+    "# Close browser",
+    "Close Browser"
+)
+
 class CloseParams(BaseModel):
     """Parameters for closing browser."""
     # No parameters needed
@@ -30,13 +36,8 @@ class CloseTool(BaseTool):
             await context.close()
             logger.info("🚪 Browser closed")
         
-        code = [
-            "# Close browser",
-            "Close Browser"
-        ]
-        
         return ToolResult(
-            code=code,
+            code=CLOSE_CODE,
             action=close_action,
             capture_snapshot=False,
             wait_for_network=False
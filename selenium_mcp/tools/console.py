@@ -3,11 +3,18 @@
 import logging
 from pydantic import BaseModel, Field
 
-from ..tool_base import BaseTool, ToolSchema, ToolResult
+from ..tool_base import BaseTool, ToolSchema, ToolResult, run_in_thread
 from ..context import Context
+from .javascript import evaluate_script
 
 logger = logging.getLogger(__name__)
 
+# Robot Framework code (static)
+CLEAR_CODE = (
+    "# Clear browser console",
+    "Execute Javascript    console.clear();"
+)
+
 class ConsoleParams(BaseModel):
     """Parameters for console operations."""
     action: str = Field(description="Console action: 'get_logs', 'clear'")
@@ -28,31 +35,37 @@ class ConsoleTool(BaseTool):
         """Handle console operations."""
         driver = context.current_tab_or_die()
         
-        async def console_action():
+        def console_action():
             if params.action == "get_logs":
                 try:
                     logs = driver.get_log('browser')
-                    filtered_logs = []
+                    want_all = params.level == "ALL"
+                    count = 0
+                    
+                    def filtered_logs():
+                        nonlocal count
+                        for log in logs:
+                            if want_all or log['level'] == params.level:
+                                count += 1
+                                yield f"[{log['level']}] {log['message']}"
                     
-                    for log in logs:
-                        if params.level == "ALL" or log['level'] == params.level:
-                            filtered_logs.append(f"[{log['level']}] {log['message']}")
+                    result = "\n".join(filtered_logs())
                     
-                    logger.info(f"📋 Retrieved {len(filtered_logs)} console logs")
-                    return "\n".join(filtered_logs) if filtered_logs else "No console logs found"
+                    logger.info("📋 Retrieved %d console logs", count)
+                    return result if count else "No console logs found"
                     
                 except Exception as e:
-                    logger.warning(f"Could not retrieve console logs: {e}")
+                    logger.warning("Could not retrieve console logs: %s", e)
                     return "Console logs not available"
                     
             elif params.action == "clear":
                 try:
                     # Clear console by executing JavaScript
-                    driver.execute_script("console.clear();")
+                    evaluate_script(driver, "console.clear();")
                     logger.info("📋 Cleared browser console")
                     return "Console cleared"
                 except Exception as e:
-                    logger.warning(f"Could not clear console: {e}")
+                    logger.warning("Could not clear console: %s", e)
                     return "Console clear failed"
             else:
                 raise ValueError(f"Invalid console action: {params.action}")
@@ -64,10 +77,7 @@ class ConsoleTool(BaseTool):
                 "# Note: Console log retrieval not directly supported in Robot Framework"
             ]
         elif params.action == "clear":
-            code = [
-                "# Clear browser console",
-                "Execute Javascript    console.clear();"
-            ]
+            code = CLEAR_CODE
         else:
             code = [
                 f"# Console action: {params.action}",
@@ -76,7 +86,7 @@ class ConsoleTool(BaseTool):
         
         return ToolResult(
             code=code,
-            action=console_action,
+            action=run_in_thread(console_action),
             capture_snapshot=False,
             wait_for_network=False
         )
\ No newline at end of file
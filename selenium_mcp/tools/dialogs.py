@@ -8,6 +8,21 @@ from ..context import Context
 
 logger = logging.getLogger(__name__)
 
+# Robot Framework code (static)
+ACCEPT_CODE = (
+    "# Accept dialog",
+    "Handle Alert    ACCEPT"
+)
+DISMISS_CODE = (
+    "# Dismiss dialog",
+    "Handle Alert    DISMISS"
+)
+GET_TEXT_CODE = (
+    "# Get dialog text",
+    "${dialog_text}=    Handle Alert    ACCEPT",
+    "Log    ${dialog_text}"
+)
+
 class DialogParams(BaseModel):
     """Parameters for dialog handling."""
     action: str = Field(description="Dialog action: 'accept', 'dismiss', or 'get_text'")
@@ -34,42 +49,38 @@ class DialogTool(BaseTool):
                 
                 if params.action == "get_text":
                     text = alert.text
-                    logger.info(f"🔔 Dialog text: {text}")
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info("🔔 Dialog text: %s", text)
                     return text
                 elif params.action == "accept":
                     if params.text:
                         alert.send_keys(params.text)
                     alert.accept()
-                    logger.info(f"🔔 Accepted dialog")
+                    logger.info("🔔 Accepted dialog")
                 elif params.action == "dismiss":
                     alert.dismiss()
-                    logger.info(f"🔔 Dismissed dialog")
+                    logger.info("🔔 Dismissed dialog")
                 else:
                     raise ValueError(f"Invalid dialog action: {params.action}")
                     
             except Exception as e:
-                logger.error(f"Dialog handling failed: {e}")
+                logger.error("Dialog handling failed: %s", e)
                 raise
         
         # Robot Framework code
         if params.action == "accept":
-            code = [
-                "# Accept dialog",
-                "Handle Alert    ACCEPT"
-            ]
             if params.text:
-                code.insert(1, f"Input Text Into Alert    {params.text}")
+                code = (
+                    ACCEPT_CODE[0],
+                    f"Input Text Into Alert    {params.text}",
+                    ACCEPT_CODE[1]
+                )
+            else:
+                code = ACCEPT_CODE
         elif params.action == "dismiss":
-            code = [
-                "# Dismiss dialog", 
-                "Handle Alert    DISMISS"
-            ]
+            code = DISMISS_CODE
         elif params.action == "get_text":
-            code = [
-                "# Get dialog text",
-                "${dialog_text}=    Handle Alert    ACCEPT",
-                "Log    ${dialog_text}"
-            ]
+            code = GET_TEXT_CODE
         else:
             code = [
                 f"# Handle dialog with action: {params.action}",
@@ -79,6 +90,6 @@ class DialogTool(BaseTool):
         return ToolResult(
             code=code,
             action=dialog_action,
-            capture_snapshot=True,
+            capture_snapshot=params.action != "get_text",  # Reading the text leaves the page unchanged
             wait_for_network=False
         )
\ No newline at end of file
@@ -8,6 +8,12 @@ from ..context import Context
 
 logger = logging.getLogger(__name__)
 
+def drag_and_drop(context: Context, driver, source_locator: tuple, target_locator: tuple) -> None:
+    """Drag the element at source_locator onto the element at target_locator."""
+    source_element = driver.find_element(*source_locator)
+    target_element = driver.find_element(*target_locator)
+    context.action_chains(driver).drag_and_drop(source_element, target_element).perform()
+
 class DragDropParams(BaseModel):
     """Parameters for drag and drop."""
     source_element: str = Field(description="Source element description")
@@ -31,24 +37,18 @@ class DragDropTool(BaseTool):
         driver = context.current_tab_or_die()
         snapshot = context.snapshot_or_die()
         
-        source_by, source_locator = snapshot.ref_locator(params.source_ref)
-        target_by, target_locator = snapshot.ref_locator(params.target_ref)
+        source = snapshot.ref_locator(params.source_ref)
+        target = snapshot.ref_locator(params.target_ref)
         
         async def drag_drop_action():
-            from selenium.webdriver.common.action_chains import ActionChains
-            
-            source_element = driver.find_element(source_by, source_locator)
-            target_element = driver.find_element(target_by, target_locator)
-            
-            actions = ActionChains(driver)
-            actions.drag_and_drop(source_element, target_element).perform()
-            
-            logger.info(f"🔄 Dragged {params.source_element} to {params.target_element}")
+            drag_and_drop(context, driver, source, target)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("🔄 Dragged %s to %s", params.source_element, params.target_element)
         
         # Robot Framework code
         code = [
             f"# Drag {params.source_element} to {params.target_element}",
-            f"Drag And Drop    {source_locator}    {target_locator}"
+            f"Drag And Drop    {source[1]}    {target[1]}"
         ]
         
         return ToolResult(
@@ -1,9 +1,10 @@
 """File upload tools."""
 
 import logging
+import os
 from pydantic import BaseModel, Field
 
-from ..tool_base import BaseTool, ToolSchema, ToolResult
+from ..tool_base import BaseTool, ToolSchema, ToolResult, run_in_thread
 from ..context import Context
 
 logger = logging.getLogger(__name__)
@@ -32,17 +33,21 @@ class FileUploadTool(BaseTool):
         
         by, locator_value = snapshot.ref_locator(params.ref)
         
-        async def upload_action():
-            import os
-            
-            # Verify file exists
-            if not os.path.exists(params.file_path):
-                raise FileNotFoundError(f"File not found: {params.file_path}")
+        file_path = os.path.abspath(params.file_path)
+        
+        def upload_action():
+            # Check the exact path handed to send_keys, just before the upload,
+            # so a missing file fails without a find_element roundtrip
+            try:
+                os.stat(file_path)
+            except FileNotFoundError as e:
+                raise FileNotFoundError(f"File not found: {params.file_path}") from e
             
             file_input = driver.find_element(by, locator_value)
-            file_input.send_keys(os.path.abspath(params.file_path))
+            file_input.send_keys(file_path)
             
-            logger.info(f"📎 Uploaded file {params.file_path} to {params.element}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("📎 Uploaded file %s to %s", params.file_path, params.element)
         
         # Robot Framework code
         code = [
@@ -52,7 +57,7 @@ class FileUploadTool(BaseTool):
         
         return ToolResult(
             code=code,
-            action=upload_action,
+            action=run_in_thread(upload_action),
             capture_snapshot=True,
             wait_for_network=True
         )
\ No newline at end of file
@@ -2,12 +2,37 @@
 
 import logging
 from pydantic import BaseModel, Field
+from selenium.common.exceptions import JavascriptException
 
-from ..tool_base import BaseTool, ToolSchema, ToolResult
+from ..tool_base import BaseTool, ToolSchema, ToolResult, run_in_thread
 from ..context import Context
 
 logger = logging.getLogger(__name__)
 
+def evaluate_script(driver, script: str, *args):
+    """Evaluate an internal script via CDP Runtime.evaluate, skipping the WebDriver script wrapper.
+    
+    Only for frame-agnostic scripts with primitive results (e.g. window.stop()):
+    Runtime.evaluate always runs in the top-level frame and returns values by
+    JSON, so DOM elements do not come back as WebElements. User scripts must
+    go through execute_script. Falls back to execute_script for non-Chromium
+    drivers or when arguments need to be marshalled.
+    """
+    if args or not hasattr(driver, "execute_cdp_cmd"):
+        return driver.execute_script(script, *args)
+    
+    response = driver.execute_cdp_cmd("Runtime.evaluate", {
+        "expression": f"(function() {{\n{script}\n}})()",
+        "returnByValue": True
+    })
+    
+    if "exceptionDetails" in response:
+        details = response["exceptionDetails"]
+        message = details.get("exception", {}).get("description") or details.get("text", "")
+        raise JavascriptException(message)
+    
+    return response["result"].get("value")
+
 class JavaScriptParams(BaseModel):
     """Parameters for JavaScript execution."""
     script: str = Field(description="JavaScript code to execute")
@@ -28,17 +53,16 @@ class JavaScriptTool(BaseTool):
         """Execute JavaScript code."""
         driver = context.current_tab_or_die()
         
-        async def js_action():
+        def js_action():
             try:
-                if params.args:
-                    result = driver.execute_script(params.script, *params.args)
-                else:
-                    result = driver.execute_script(params.script)
+                # execute_script honours the selected frame and returns WebElements
+                result = driver.execute_script(params.script, *params.args)
                 
-                logger.info(f"🟡 Executed JavaScript: {params.script[:100]}...")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("🟡 Executed JavaScript: %s...", params.script[:100])
                 return result
             except Exception as e:
-                logger.error(f"JavaScript execution failed: {e}")
+                logger.error("JavaScript execution failed: %s", e)
                 raise
         
         # Robot Framework code
@@ -52,7 +76,7 @@ class JavaScriptTool(BaseTool):
         
         return ToolResult(
             code=code,
-            action=js_action,
+            action=run_in_thread(js_action),
             capture_snapshot=True,
             wait_for_network=False
         )
\ No newline at end of file
@@ -32,11 +32,15 @@ class TypeTool(BaseTool):
         
         by, locator_value = snapshot.ref_locator(params.ref)
         
-        async def type_action():
-            element = driver.find_element(by, locator_value)
+        def type_into(element):
             element.clear()
             element.send_keys(params.text)
-            logger.info(f"⌨️ Typed '{params.text}' into {params.element}")
+        
+        async def type_action():
+            # Use the element captured with the snapshot; re-found only if stale
+            snapshot.with_element(driver, params.ref, type_into)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("⌨️ Typed '%s' into %s", params.text, params.element)
         
         code = [
             f"# Type text into {params.element}",
@@ -2,12 +2,51 @@
 
 import logging
 from pydantic import BaseModel, Field
+from selenium.webdriver.common.keys import Keys
 
 from ..tool_base import BaseTool, ToolSchema, ToolResult
 from ..context import Context
 
 logger = logging.getLogger(__name__)
 
+# Named keys accepted in params.key, mapped to Selenium key codes
+KEY_MAPPING = {
+    'Enter': Keys.ENTER,
+    'Tab': Keys.TAB,
+    'Escape': Keys.ESCAPE,
+    'Space': Keys.SPACE,
+    'ArrowUp': Keys.ARROW_UP,
+    'ArrowDown': Keys.ARROW_DOWN,
+    'ArrowLeft': Keys.ARROW_LEFT,
+    'ArrowRight': Keys.ARROW_RIGHT,
+    'F1': Keys.F1,
+    'F2': Keys.F2,
+    'F3': Keys.F3,
+    'F4': Keys.F4,
+    'F5': Keys.F5,
+    'F6': Keys.F6,
+    'F7': Keys.F7,
+    'F8': Keys.F8,
+    'F9': Keys.F9,
+    'F10': Keys.F10,
+    'F11': Keys.F11,
+    'F12': Keys.F12,
+    'Home': Keys.HOME,
+    'End': Keys.END,
+    'PageUp': Keys.PAGE_UP,
+    'PageDown': Keys.PAGE_DOWN,
+    'Delete': Keys.DELETE,
+    'Backspace': Keys.BACKSPACE,
+}
+
+# Modifier names accepted in params.modifiers (case-insensitive)
+MODIFIER_MAPPING = {
+    'ctrl': Keys.CONTROL,
+    'alt': Keys.ALT,
+    'shift': Keys.SHIFT,
+    'meta': Keys.META,
+}
+
 class KeyPressParams(BaseModel):
     """Parameters for key press."""
     key: str = Field(description="Key to press (e.g., 'Enter', 'Tab', 'Escape', 'F1', etc.)")
@@ -28,74 +67,32 @@ class KeyPressTool(BaseTool):
         """Press key with modifiers."""
         driver = context.current_tab_or_die()
         
+        modifier_keys = [
+            MODIFIER_MAPPING[modifier.lower()]
+            for modifier in params.modifiers
+            if modifier.lower() in MODIFIER_MAPPING
+        ]
+        modifier_text = "".join(modifier + "+" for modifier in params.modifiers)
+        
         async def key_action():
-            from selenium.webdriver.common.keys import Keys
-            from selenium.webdriver.common.action_chains import ActionChains
-            
-            actions = ActionChains(driver)
+            actions = context.action_chains(driver)
             
             # Hold down modifiers
-            for modifier in params.modifiers:
-                if modifier.lower() == 'ctrl':
-                    actions = actions.key_down(Keys.CONTROL)
-                elif modifier.lower() == 'alt':
-                    actions = actions.key_down(Keys.ALT)
-                elif modifier.lower() == 'shift':
-                    actions = actions.key_down(Keys.SHIFT)
-                elif modifier.lower() == 'meta':
-                    actions = actions.key_down(Keys.META)
+            for modifier_key in modifier_keys:
+                actions = actions.key_down(modifier_key)
             
             # Press the main key
-            key_mapping = {
-                'Enter': Keys.ENTER,
-                'Tab': Keys.TAB,
-                'Escape': Keys.ESCAPE,
-                'Space': Keys.SPACE,
-                'ArrowUp': Keys.ARROW_UP,
-                'ArrowDown': Keys.ARROW_DOWN,
-                'ArrowLeft': Keys.ARROW_LEFT,
-                'ArrowRight': Keys.ARROW_RIGHT,
-                'F1': Keys.F1,
-                'F2': Keys.F2,
-                'F3': Keys.F3,
-                'F4': Keys.F4,
-                'F5': Keys.F5,
-                'F6': Keys.F6,
-                'F7': Keys.F7,
-                'F8': Keys.F8,
-                'F9': Keys.F9,
-                'F10': Keys.F10,
-                'F11': Keys.F11,
-                'F12': Keys.F12,
-                'Home': Keys.HOME,
-                'End': Keys.END,
-                'PageUp': Keys.PAGE_UP,
-                'PageDown': Keys.PAGE_DOWN,
-                'Delete': Keys.DELETE,
-                'Backspace': Keys.BACKSPACE,
-            }
-            
-            selenium_key = key_mapping.get(params.key, params.key)
-            actions = actions.send_keys(selenium_key)
+            actions = actions.send_keys(KEY_MAPPING.get(params.key, params.key))
             
             # Release modifiers
-            for modifier in params.modifiers:
-                if modifier.lower() == 'ctrl':
-                    actions = actions.key_up(Keys.CONTROL)
-                elif modifier.lower() == 'alt':
-                    actions = actions.key_up(Keys.ALT)
-                elif modifier.lower() == 'shift':
-                    actions = actions.key_up(Keys.SHIFT)
-                elif modifier.lower() == 'meta':
-                    actions = actions.key_up(Keys.META)
+            for modifier_key in modifier_keys:
+                actions = actions.key_up(modifier_key)
             
             actions.perform()
             
-            modifier_text = "+".join(params.modifiers) + "+" if params.modifiers else ""
-            logger.info(f"⌨️ Pressed key: {modifier_text}{params.key}")
+            logger.info("⌨️ Pressed key: %s%s", modifier_text, params.key)
         
         # Robot Framework code
-        modifier_text = "+".join(params.modifiers) + "+" if params.modifiers else ""
         code = [
             f"# Press key: {modifier_text}{params.key}",
             f"Press Keys    None    {modifier_text}{params.key}"
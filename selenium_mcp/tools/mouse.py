@@ -5,6 +5,7 @@ from pydantic import BaseModel, Field
 
 from ..tool_base import BaseTool, ToolSchema, ToolResult
 from ..context import Context
+from .drag import drag_and_drop
 
 logger = logging.getLogger(__name__)
 
@@ -41,7 +42,7 @@ class MouseMoveTool(BaseTool):
         """Move mouse to coordinates."""
         
         async def move_action():
-            logger.info(f"🖱️ Moving mouse to coordinates ({params.x}, {params.y})")
+            logger.info("🖱️ Moving mouse to coordinates (%s, %s)", params.x, params.y)
         
         code = [
             f"# Move mouse to coordinates ({params.x}, {params.y})",
@@ -74,9 +75,10 @@ class MouseClickTool(BaseTool):
         by, locator_value = snapshot.ref_locator(params.ref)
         
         async def click_action():
-            element = driver.find_element(by, locator_value)
-            element.click()
-            logger.info(f"🖱️ Clicked on {params.element} with {params.button} button")
+            # Native click on the element captured with the snapshot; re-found only if stale
+            snapshot.with_element(driver, params.ref, lambda element: element.click())
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("🖱️ Clicked on %s with %s button", params.element, params.button)
         
         code = [
             f"# Click on {params.element}",
@@ -106,19 +108,17 @@ class MouseDragTool(BaseTool):
         driver = context.current_tab_or_die()
         snapshot = context.snapshot_or_die()
         
-        from_by, from_locator = snapshot.ref_locator(params.from_ref)
-        to_by, to_locator = snapshot.ref_locator(params.to_ref)
+        source = snapshot.ref_locator(params.from_ref)
+        target = snapshot.ref_locator(params.to_ref)
         
         async def drag_action():
-            from selenium.webdriver.common.action_chains import ActionChains
-            source = driver.find_element(from_by, from_locator)
-            target = driver.find_element(to_by, to_locator)
-            ActionChains(driver).drag_and_drop(source, target).perform()
-            logger.info(f"🖱️ Dragged from {params.from_element} to {params.to_element}")
+            drag_and_drop(context, driver, source, target)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("🖱️ Dragged from %s to %s", params.from_element, params.to_element)
         
         code = [
             f"# Drag from {params.from_element} to {params.to_element}",
-            f"Drag And Drop    {from_locator}    {to_locator}"
+            f"Drag And Drop    {source[1]}    {target[1]}"
         ]
         
         return ToolResult(
@@ -1,13 +1,26 @@
 """Navigation tools - matches playwright-mcp navigation exactly."""
 
+import asyncio
 import logging
 from pydantic import BaseModel, Field
+from selenium.common.exceptions import TimeoutException
 
 from ..tool_base import BaseTool, ToolSchema, ToolResult
 from ..context import Context
+from .javascript import evaluate_script
 
 logger = logging.getLogger(__name__)
 
+# Robot Framework code (static)
+BACK_CODE = (
+    "# Go back to previous page",
+    "Go Back"
+)
+FORWARD_CODE = (
+    "# Go forward to next page",
+    "Go Forward"
+)
+
 class NavigateParams(BaseModel):
     """Parameters for navigation."""
     url: str = Field(description="The URL to navigate to")
@@ -35,26 +48,27 @@ class NavigateTool(BaseTool):
         """Navigate to URL."""
         
         # Debug: Log the received URL
-        logger.info(f"🔍 Navigation request received: URL='{params.url}'")
+        logger.info("🔍 Navigation request received: URL='%s'", params.url)
         
         if not params.url or params.url.strip() == "":
             logger.error("❌ Empty URL received")
             raise ValueError("URL parameter is required and cannot be empty")
         
-        # Navigation action
-        async def navigate_action():
-            driver = await context.ensure_browser()
-            # Set page load timeout to prevent hanging
-            driver.set_page_load_timeout(30)
-            
+        def load_page(driver):
             try:
                 driver.get(params.url)
-                logger.info(f"🚀 Navigated to: {params.url}")
-            except Exception as e:
-                # If page load times out, continue anyway
-                logger.warning(f"⚠️ Page load timeout for {params.url}, continuing anyway")
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("🚀 Navigated to: %s", params.url)
+            except TimeoutException:
+                # If page load times out, continue anyway; other errors propagate
+                logger.warning("⚠️ Page load timeout for %s, continuing anyway", params.url)
                 # Execute JavaScript to stop loading
-                driver.execute_script("window.stop();")
+                evaluate_script(driver, "window.stop();")
+        
+        # Navigation action
+        async def navigate_action():
+            driver = await context.ensure_browser()
+            await asyncio.to_thread(load_page, driver)
         
         # Robot Framework code
         code = [
@@ -89,14 +103,8 @@ class GoBackTool(BaseTool):
             driver.back()
             logger.info("⬅️ Went back")
         
-        # Robot Framework code
-        code = [
-            "# Go back to previous page",
-            "Go Back"
-        ]
-        
         return ToolResult(
-            code=code,
+            code=BACK_CODE,
             action=back_action,
             capture_snapshot=True,
             wait_for_network=True
@@ -122,14 +130,8 @@ class GoForwardTool(BaseTool):
             driver.forward()
             logger.info("➡️ Went forward")
         
-        # Robot Framework code
-        code = [
-            "# Go forward to next page",
-            "Go Forward"
-        ]
-        
         return ToolResult(
-            code=code,
+            code=FORWARD_CODE,
             action=forward_action,
             capture_snapshot=True,
             wait_for_network=True
@@ -3,11 +3,39 @@
 import logging
 from pydantic import BaseModel, Field
 
+try:
+    import orjson as json  # Optional C parser for large performance logs
+except ImportError:
+    import json
+
 from ..tool_base import BaseTool, ToolSchema, ToolResult
 from ..context import Context
 
 logger = logging.getLogger(__name__)
 
+# Performance-log events that carry an outgoing request (method + url)
+NETWORK_REQUEST_METHODS = frozenset({"Network.requestWillBeSent"})
+
+# Robot Framework code for each network action (set_offline is keyed by mode)
+NETWORK_CODE = {
+    "get_requests": (
+        "# Get network requests",
+        "# Note: Network request monitoring not directly supported in Robot Framework"
+    ),
+    "clear": (
+        "# Clear network logs",
+        "# Note: Network log clearing not directly supported in Robot Framework"
+    ),
+    "offline": (
+        "# Set network to offline mode",
+        "# Note: Network mode control not directly supported in Robot Framework"
+    ),
+    "online": (
+        "# Set network to online mode",
+        "# Note: Network mode control not directly supported in Robot Framework"
+    ),
+}
+
 class NetworkParams(BaseModel):
     """Parameters for network operations."""
     action: str = Field(description="Network action: 'get_requests', 'clear', 'set_offline'")
@@ -33,27 +61,37 @@ class NetworkTool(BaseTool):
                 try:
                     # Get performance logs if available
                     logs = driver.get_log('performance')
-                    network_requests = []
+                    count = 0
                     
-                    for log in logs:
-                        message = log.get('message', {})
-                        if isinstance(message, str):
-                            import json
+                    def network_requests():
+                        nonlocal count
+                        for log in logs:
+                            message = log.get('message', {})
+                            if isinstance(message, str):
+                                # Cheap substring check skips parsing events we never report
+                                if 'Network.requestWillBeSent' not in message:
+                                    continue
+                                try:
+                                    message = json.loads(message)
+                                except ValueError:
+                                    continue
+                                    
                             try:
-                                message = json.loads(message)
-                            except:
+                                inner = message['message']
+                                if inner['method'] not in NETWORK_REQUEST_METHODS:
+                                    continue
+                                request = inner['params']['request']
+                                line = f"{request['method']} {request['url']}"
+                            except (KeyError, TypeError):
                                 continue
-                                
-                        method = message.get('message', {}).get('method', '')
-                        if 'Network.' in method:
-                            params_data = message.get('message', {}).get('params', {})
-                            if 'request' in params_data:
-                                url = params_data['request'].get('url', '')
-                                method_type = params_data['request'].get('method', '')
-                                network_requests.append(f"{method_type} {url}")
+                            count += 1
+                            yield line
+                    
+                    # Joined as str: the MCP response is text, so pre-encoding to bytes would only add a decode pass
+                    result = "\n".join(network_requests())
                     
-                    logger.info(f"🌐 Retrieved {len(network_requests)} network requests")
-                    return "\n".join(network_requests) if network_requests else "No network requests found"
+                    logger.info(f"🌐 Retrieved {count} network requests")
+                    return result if count else "No network requests found"
                     
                 except Exception as e:
                     logger.warning(f"Could not retrieve network requests: {e}")
@@ -72,7 +110,11 @@ class NetworkTool(BaseTool):
             elif params.action == "set_offline":
                 try:
                     # Set network offline mode using Chrome DevTools
-                    driver.execute_cdp_cmd('Network.enable', {})
+                    if context.cdp_network_driver is not driver:
+                        driver.execute_cdp_cmd('Network.enable', {})
+                        context.cdp_network_driver = driver
+                    # Bypass the HTTP cache so offline mode isn't masked by cached responses
+                    driver.execute_cdp_cmd('Network.setCacheDisabled', {'cacheDisabled': params.offline})
                     driver.execute_cdp_cmd('Network.emulateNetworkConditions', {
                         'offline': params.offline,
                         'latency': 0,
@@ -90,27 +132,16 @@ class NetworkTool(BaseTool):
                 raise ValueError(f"Invalid network action: {params.action}")
         
         # Robot Framework code
-        if params.action == "get_requests":
-            code = [
-                "# Get network requests",
-                "# Note: Network request monitoring not directly supported in Robot Framework"
-            ]
-        elif params.action == "clear":
-            code = [
-                "# Clear network logs", 
-                "# Note: Network log clearing not directly supported in Robot Framework"
-            ]
-        elif params.action == "set_offline":
-            mode = "offline" if params.offline else "online"
-            code = [
-                f"# Set network to {mode} mode",
-                "# Note: Network mode control not directly supported in Robot Framework"
-            ]
+        if params.action == "set_offline":
+            code_key = "offline" if params.offline else "online"
         else:
-            code = [
+            code_key = params.action
+        code = NETWORK_CODE.get(code_key)
+        if code is None:
+            code = (
                 f"# Network action: {params.action}",
                 "# Note: Network operations limited in Robot Framework"
-            ]
+            )
         
         return ToolResult(
             code=code,
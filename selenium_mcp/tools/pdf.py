@@ -1,13 +1,70 @@
 """PDF generation tools."""
 
+import base64
 import logging
+import os
+from contextlib import contextmanager
 from pydantic import BaseModel, Field
 
-from ..tool_base import BaseTool, ToolSchema, ToolResult
+try:
+    from selenium.webdriver.common.print_page_options import PrintOptions
+except ImportError:  # Selenium without print support; only the CDP path is available
+    PrintOptions = None
+
+from ..tool_base import BaseTool, ToolSchema, ToolResult, run_in_thread
 from ..context import Context
 
 logger = logging.getLogger(__name__)
 
+# Base64 slice size for streamed decoding; a multiple of 4 keeps groups aligned
+BASE64_CHUNK_SIZE = 65532
+
+# Bytes requested per CDP IO.read call when streaming the PDF
+STREAM_READ_SIZE = 262144
+
+# File buffer for PDF output; decoded chunks are coalesced into ~1MB write() calls
+WRITE_BUFFER_SIZE = 1 << 20
+
+def write_base64(f, data: str) -> None:
+    """Decode base64 data into an open binary file slice by slice."""
+    for start in range(0, len(data), BASE64_CHUNK_SIZE):
+        f.write(base64.b64decode(data[start:start + BASE64_CHUNK_SIZE]))
+
+# fdatasync is unavailable on macOS; fall back to fsync there
+_datasync = getattr(os, "fdatasync", os.fsync)
+
+@contextmanager
+def atomic_write(file_path: str):
+    """Write to a temp file next to file_path and move it into place once synced.
+    
+    A failed generation never leaves a truncated PDF behind.
+    """
+    tmp_path = file_path + '.part'
+    try:
+        with open(tmp_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            yield f
+            f.flush()
+            _datasync(f.fileno())
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def write_cdp_stream(driver, f, stream: str) -> None:
+    """Copy a CDP IO stream into an open binary file chunk by chunk, then close it."""
+    try:
+        while True:
+            chunk = driver.execute_cdp_cmd('IO.read', {'handle': stream, 'size': STREAM_READ_SIZE})
+            if chunk.get('base64Encoded'):
+                write_base64(f, chunk['data'])
+            else:
+                f.write(chunk['data'].encode())
+            if chunk.get('eof'):
+                break
+    finally:
+        driver.execute_cdp_cmd('IO.close', {'handle': stream})
+
 class PDFParams(BaseModel):
     """Parameters for PDF generation."""
     file_path: str = Field(description="Path where to save the PDF file")
@@ -31,16 +88,14 @@ class PDFTool(BaseTool):
         """Generate PDF from current page."""
         driver = context.current_tab_or_die()
         
-        async def pdf_action():
+        def pdf_action():
             try:
-                import os
-                import json
-                
                 # Prepare print options
                 print_options = {
                     'paperFormat': params.format,
                     'landscape': params.landscape,
-                    'printBackground': params.print_background
+                    'printBackground': params.print_background,
+                    'transferMode': 'ReturnAsStream'
                 }
                 
                 # Add margins if specified
@@ -53,12 +108,12 @@ class PDFTool(BaseTool):
                 # Generate PDF using Chrome DevTools
                 result = driver.execute_cdp_cmd('Page.printToPDF', print_options)
                 
-                # Save PDF data to file
-                pdf_data = result['data']
-                import base64
-                
-                with open(params.file_path, 'wb') as f:
-                    f.write(base64.b64decode(pdf_data))
+                # Save PDF data to file, reading the stream in chunks when Chrome returns one
+                with atomic_write(params.file_path) as f:
+                    if result.get('stream'):
+                        write_cdp_stream(driver, f, result['stream'])
+                    else:
+                        write_base64(f, result['data'])
                 
                 logger.info(f"📄 Generated PDF: {params.file_path}")
                 return f"PDF saved to {params.file_path}"
@@ -68,15 +123,17 @@ class PDFTool(BaseTool):
                 
                 # Fallback: try using selenium's print functionality
                 try:
-                    from selenium.webdriver.common.print_page_options import PrintOptions
+                    if PrintOptions is None:
+                        raise RuntimeError("print_page is not supported by this Selenium version")
                     
                     print_options = PrintOptions()
                     print_options.page_ranges = ['1-']
                     
+                    # print_page returns the PDF base64-encoded
                     pdf_data = driver.print_page(print_options)
                     
-                    with open(params.file_path, 'wb') as f:
-                        f.write(pdf_data)
+                    with atomic_write(params.file_path) as f:
+                        write_base64(f, pdf_data)
                         
                     logger.info(f"📄 Generated PDF (fallback): {params.file_path}")
                     return f"PDF saved to {params.file_path}"
@@ -87,15 +144,15 @@ class PDFTool(BaseTool):
         
         # Robot Framework code
         orientation = "landscape" if params.landscape else "portrait"
-        code = [
+        code = (
             f"# Generate PDF to {params.file_path}",
             f"# Format: {params.format}, Orientation: {orientation}",
             "# Note: PDF generation not directly supported in Robot Framework"
-        ]
+        )
         
         return ToolResult(
             code=code,
-            action=pdf_action,
+            action=run_in_thread(pdf_action),
             capture_snapshot=False,
             wait_for_network=False
         )
\ No newline at end of file
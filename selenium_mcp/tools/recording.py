@@ -1,10 +1,13 @@
 """Recording control tools for action tracking."""
 
+from itertools import islice
 from typing import Optional
 from pydantic import BaseModel, Field
 from selenium_mcp.tool_base import BaseTool, ToolSchema
 from selenium_mcp.context import Context, ToolResult
 
+START_RECORDING_CODE = ("Recording started - all browser actions will be tracked",)
+
 class StartRecordingParams(BaseModel):
     """Parameters for starting recording."""
     pass
@@ -38,7 +41,7 @@ class StartRecordingTool(BaseTool):
         context.action_history.clear()  # Clear any previous recordings
         
         return ToolResult(
-            code=[f"Recording started - all browser actions will be tracked"],
+            code=START_RECORDING_CODE,
             capture_snapshot=False
         )
 
@@ -59,7 +62,7 @@ class StopRecordingTool(BaseTool):
         action_count = len(context.action_history)
         
         return ToolResult(
-            code=[f"Recording stopped - captured {action_count} actions"],
+            code=(f"Recording stopped - captured {action_count} actions",),
             capture_snapshot=False
         )
 
@@ -87,7 +90,8 @@ class RecordingStatusTool(BaseTool):
         
         if context.action_history:
             result_lines.append("Recent Actions:")
-            for i, action in enumerate(context.action_history[-5:], 1):  # Show last 5
+            recent_actions = islice(context.action_history, max(0, action_count - 5), None)
+            for i, action in enumerate(recent_actions, 1):  # Show last 5
                 result_lines.append(f"  {i}. {action['tool']} - {action.get('params', {})}")
             
             if len(context.action_history) > 5:
@@ -115,6 +119,6 @@ class ClearRecordingTool(BaseTool):
         context.action_history.clear()
         
         return ToolResult(
-            code=[f"Cleared {action_count} recorded actions"],
+            code=(f"Cleared {action_count} recorded actions",),
             capture_snapshot=False
         )
\ No newline at end of file
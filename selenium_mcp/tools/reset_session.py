@@ -1,13 +1,30 @@
 """Session reset tool to force clean automation browser restart."""
 
+import asyncio
 import logging
-import subprocess
 from pydantic import BaseModel
 from selenium_mcp.tool_base import BaseTool, ToolSchema, ToolResult
 from selenium_mcp.context import Context
 
 logger = logging.getLogger(__name__)
 
+# Chrome processes started with automation flags (personal Chrome is left alone)
+AUTOMATION_CHROME_PATTERN = "Google Chrome.*(--remote-debugging-port|--test-type|--no-sandbox)"
+
+RESET_CODE = (
+    "# Force reset automation browser session only",
+    "# This kills only automation Chrome/ChromeDriver processes"
+)
+
+async def run_command(*args: str) -> int:
+    """Run a command without blocking the event loop and return its exit code."""
+    process = await asyncio.create_subprocess_exec(
+        *args,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.DEVNULL
+    )
+    return await process.wait()
+
 class ResetSessionParams(BaseModel):
     """Parameters for resetting automation browser session."""
     pass
@@ -40,21 +57,17 @@ class ResetSessionTool(BaseTool):
             
             # Kill only ChromeDriver processes (not personal Chrome)
             try:
-                # Kill ChromeDriver processes specifically
-                subprocess.run(["pkill", "-f", "chromedriver"], capture_output=True)
-                
-                # Kill Chrome processes that have automation flags
-                # Look for Chrome processes with --remote-debugging-port or --test-type
-                result = subprocess.run(["pgrep", "-fl", "Google Chrome"], capture_output=True, text=True)
-                if result.stdout:
-                    for line in result.stdout.split('\n'):
-                        if line and ('--remote-debugging-port' in line or '--test-type' in line or '--no-sandbox' in line):
-                            pid = line.split()[0]
-                            try:
-                                subprocess.run(["kill", pid], capture_output=True)
-                                logger.info(f"✅ Killed automation Chrome process {pid}")
-                            except:
-                                pass
+                # Kill ChromeDriver processes and Chrome processes with automation flags
+                _, chrome_returncode = await asyncio.gather(
+                    run_command("pkill", "-f", "chromedriver"),
+                    run_command("pkill", "-f", AUTOMATION_CHROME_PATTERN)
+                )
+                if chrome_returncode == 0:
+                    logger.info("✅ Sent SIGTERM to automation Chrome processes")
+                    
+                    # Give them a moment to exit, then force-kill any stragglers
+                    await asyncio.sleep(0.2)
+                    await run_command("pkill", "-9", "-f", AUTOMATION_CHROME_PATTERN)
                 
                 logger.info("✅ Killed automation browser processes only")
             except Exception as e:
@@ -68,13 +81,8 @@ class ResetSessionTool(BaseTool):
             
             return {"status": "Automation session reset complete - personal Chrome untouched"}
         
-        code = [
-            "# Force reset automation browser session only",
-            "# This kills only automation Chrome/ChromeDriver processes"
-        ]
-        
         return ToolResult(
-            code=code,
+            code=RESET_CODE,
             action=reset_action,
             capture_snapshot=False
         )
\ No newline at end of file
@@ -1,5 +1,7 @@
 """Screenshot tools."""
 
+import asyncio
+import base64
 import logging
 from pydantic import BaseModel, Field
 
@@ -8,9 +10,14 @@ from ..context import Context
 
 logger = logging.getLogger(__name__)
 
+# JPEG encodes much faster than PNG; used when the filename asks for it
+JPEG_EXTENSIONS = (".jpg", ".jpeg")
+JPEG_QUALITY = 80
+
 class ScreenshotParams(BaseModel):
     """Parameters for taking screenshot."""
     filename: str = Field(default="screenshot.png", description="Filename for the screenshot")
+    full_page: bool = Field(default=False, description="Capture the full scrollable page instead of only the viewport")
 
 class ScreenshotTool(BaseTool):
     """Take screenshot."""
@@ -26,15 +33,46 @@ class ScreenshotTool(BaseTool):
     async def handle(self, context: Context, params: ScreenshotParams) -> ToolResult:
         """Take screenshot."""
         
+        def capture(driver):
+            if hasattr(driver, "execute_cdp_cmd"):
+                # Capture straight from Chrome, skipping the WebDriver screenshot endpoint
+                capture_params = {"format": "png", "optimizeForSpeed": True}
+                if params.filename.lower().endswith(JPEG_EXTENSIONS):
+                    capture_params.update(format="jpeg", quality=JPEG_QUALITY)
+                
+                if params.full_page:
+                    # Render the whole page in one pass, clipped to its content size
+                    metrics = driver.execute_cdp_cmd("Page.getLayoutMetrics", {})
+                    content_size = metrics.get("cssContentSize") or metrics["contentSize"]
+                    capture_params.update(
+                        captureBeyondViewport=True,
+                        clip={
+                            "x": 0,
+                            "y": 0,
+                            "width": content_size["width"],
+                            "height": content_size["height"],
+                            "scale": 1
+                        }
+                    )
+                
+                result = driver.execute_cdp_cmd("Page.captureScreenshot", capture_params)
+                with open(params.filename, "wb") as f:
+                    f.write(base64.b64decode(result["data"]))
+            elif params.full_page and hasattr(driver, "save_full_page_screenshot"):
+                driver.save_full_page_screenshot(params.filename)
+            else:
+                driver.save_screenshot(params.filename)
+            logger.info(f"📸 Screenshot saved: {params.filename}")
+        
         async def screenshot_action():
             driver = await context.ensure_browser()
-            driver.save_screenshot(params.filename)
-            logger.info(f"📸 Screenshot saved: {params.filename}")
+            # WebDriver calls block on HTTP; keep them off the event loop
+            await asyncio.to_thread(capture, driver)
         
-        code = [
-            f"# Take screenshot",
+        code = (
+            "# Take screenshot",
             f"Capture Page Screenshot    {params.filename}"
-        ]
+        )
         
         return ToolResult(
             code=code,
@@ -1,11 +1,428 @@
 """Script generation tool for creating test scripts from recorded actions."""
 
-import json
+import asyncio
+import io
+import sys
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache, partial
 from typing import List, Dict, Any, Optional
 from pydantic import BaseModel, Field
 from selenium_mcp.tool_base import BaseTool, ToolSchema
 from selenium_mcp.context import Context, ToolResult
 
+# Shared indentation strings by nesting level (INDENT[2] is eight spaces)
+INDENT = tuple(sys.intern(" " * (4 * level)) for level in range(4))
+
+# Static scaffolding for generated scripts, rendered once at import
+SELENIUM_PYTHON_IMPORTS = (
+    "from selenium import webdriver\n"
+    "from selenium.webdriver.common.by import By\n"
+    "from selenium.webdriver.support.ui import WebDriverWait\n"
+    "from selenium.webdriver.support import expected_conditions as EC\n"
+    "from selenium.webdriver.common.keys import Keys\n"
+    "import time\n"
+)
+
+PYTEST_SETUP = (
+    "import pytest\n"
+    + SELENIUM_PYTHON_IMPORTS +
+    "\n"
+    "@pytest.fixture\n"
+    "def driver():\n"
+    "    driver = webdriver.Chrome()\n"
+    "    driver.maximize_window()\n"
+    "    yield driver\n"
+    "    driver.quit()\n"
+    "\n"
+    "\n"
+)
+
+UNITTEST_SETUP = "import unittest\n" + SELENIUM_PYTHON_IMPORTS + "\n\n"
+
+UNITTEST_TEARDOWN = (
+    "\n"
+    "\n"
+    "\n"
+    "if __name__ == '__main__':\n"
+    "    unittest.main()"
+)
+
+SELENIUM_PYTHON_SETUP = (
+    SELENIUM_PYTHON_IMPORTS +
+    "\n"
+    "# Auto-generated test from recorded browser actions\n"
+    "driver = webdriver.Chrome()\n"
+    "driver.maximize_window()\n"
+    "\n"
+    "try:"
+)
+
+SELENIUM_PYTHON_TEARDOWN = (
+    "\n"
+    "\n"
+    "finally:\n"
+    "    driver.quit()"
+)
+
+ROBOT_FRAMEWORK_SETUP = (
+    "*** Settings ***\n"
+    "Documentation    Auto-generated test from recorded browser actions\n"
+    "Library          SeleniumLibrary\n"
+    "Test Setup       Open Browser To Test Page\n"
+    "Test Teardown    Close Browser\n"
+    "\n"
+    "*** Variables ***\n"
+    "${BROWSER}        Chrome\n"
+    "${TIMEOUT}       10s\n"
+    "\n"
+    "*** Test Cases ***\n"
+)
+
+ROBOT_FRAMEWORK_TEARDOWN = (
+    "\n"
+    "\n"
+    "*** Keywords ***\n"
+    "Open Browser To Test Page\n"
+    "    Open Browser    about:blank    ${BROWSER}\n"
+    "    Maximize Browser Window\n"
+    "    Set Selenium Timeout    ${TIMEOUT}"
+)
+
+PLAYWRIGHT_IMPORTS = (
+    "import asyncio\n"
+    "from playwright.async_api import async_playwright, expect\n"
+    "\n"
+    "\n"
+)
+
+PLAYWRIGHT_SETUP = (
+    "\n"
+    "    async with async_playwright() as p:\n"
+    "        browser = await p.chromium.launch(headless=False)\n"
+    "        context = await browser.new_context()\n"
+    "        page = await context.new_page()\n"
+    "\n"
+    "        try:"
+)
+
+PLAYWRIGHT_TEARDOWN = (
+    "\n"
+    "\n"
+    "        finally:\n"
+    "            await browser.close()\n"
+    "\n"
+    "\n"
+    "if __name__ == '__main__':\n"
+)
+
+WEBDRIVERIO_TEARDOWN = (
+    "\n"
+    "    });\n"
+    "});"
+)
+
+SELENIUM_JAVA_IMPORTS = (
+    "import org.openqa.selenium.By;\n"
+    "import org.openqa.selenium.WebDriver;\n"
+    "import org.openqa.selenium.WebElement;\n"
+    "import org.openqa.selenium.chrome.ChromeDriver;\n"
+    "import org.openqa.selenium.support.ui.WebDriverWait;\n"
+    "import org.openqa.selenium.support.ui.ExpectedConditions;\n"
+    "import java.time.Duration;\n"
+    "\n"
+)
+
+SELENIUM_JAVA_TEARDOWN = (
+    "\n"
+    "        } finally {\n"
+    "            driver.quit();\n"
+    "        }\n"
+    "    }\n"
+    "}"
+)
+
+SELENIUM_JS_TEARDOWN = (
+    "\n"
+    "    } finally {\n"
+    "        await driver.quit();\n"
+    "    }\n"
+    "}\n"
+    "\n"
+)
+
+# Per-test header/footer lines; format strings over the fields from script_names()
+PYTEST_HEADER = (
+    "def {test_name}(driver):\n"
+    "    \"\"\"Auto-generated test from recorded browser actions.\"\"\""
+)
+
+UNITTEST_HEADER = (
+    "class {class_name}(unittest.TestCase):\n"
+    "    \"\"\"Auto-generated test from recorded browser actions.\"\"\"\n"
+    "\n"
+    "    def setUp(self):\n"
+    "        self.driver = webdriver.Chrome()\n"
+    "        self.driver.maximize_window()\n"
+    "\n"
+    "    def tearDown(self):\n"
+    "        self.driver.quit()\n"
+    "\n"
+    "    def {test_name}(self):\n"
+    "        driver = self.driver"
+)
+
+ROBOT_FRAMEWORK_HEADER = (
+    "{title}\n"
+    "    [Documentation]    Auto-generated test scenario"
+)
+
+PLAYWRIGHT_HEADER = (
+    "async def {test_name}():\n"
+    "    \"\"\"Auto-generated test from recorded browser actions.\"\"\""
+)
+
+WEBDRIVERIO_HEADER = (
+    "describe('Auto-generated Test Suite', () => {{\n"
+    "    it('{spec_title}', async () => {{\n"
+    "        // Auto-generated test from recorded browser actions"
+)
+
+SELENIUM_JAVA_HEADER = (
+    "public class {class_name} {{\n"
+    "    // Auto-generated test from recorded browser actions\n"
+    "    public static void main(String[] args) {{\n"
+    "        WebDriver driver = new ChromeDriver();\n"
+    "        WebDriverWait wait = new WebDriverWait(driver, Duration.ofSeconds(10));\n"
+    "        \n"
+    "        try {{"
+)
+
+SELENIUM_JS_HEADER = (
+    "const {{ Builder, By, until }} = require('selenium-webdriver');\n"
+    "\n"
+    "async function {test_name}() {{\n"
+    "    // Auto-generated test from recorded browser actions\n"
+    "    let driver = await new Builder().forBrowser('chrome').build();\n"
+    "    \n"
+    "    try {{"
+)
+
+# Code templates per output language and recorded tool; {indent}, {selector} and action params are filled in
+ACTION_TEMPLATES = {
+    "selenium_python": {
+        "navigate_to": '{indent}driver.get("{url}")',
+        "click_element": '{indent}driver.find_element(By.XPATH, "{selector}").click()',
+        "input_text": '{indent}driver.find_element(By.XPATH, "{selector}").send_keys("{text}")',
+        "take_screenshot": '{indent}driver.save_screenshot("{filename}")',
+        "wait_for": '{indent}WebDriverWait(driver, {timeout}).until(lambda d: d.execute_script("return document.readyState") == "complete")',
+    },
+    "robot_framework": {
+        "navigate_to": '{indent}Go To    {url}',
+        "click_element": '{indent}Click Element    {selector}',
+        "input_text": '{indent}Input Text    {selector}    {text}',
+        "take_screenshot": '{indent}Capture Page Screenshot    {filename}',
+    },
+    "playwright": {
+        "navigate_to": '{indent}await page.goto("{url}")',
+        "click_element": '{indent}await page.click("{selector}")',
+        "input_text": '{indent}await page.fill("{selector}", "{text}")',
+        "take_screenshot": '{indent}await page.screenshot(path="{filename}")',
+    },
+    "webdriverio": {
+        "navigate_to": '{indent}await browser.url("{url}");',
+        "click_element": '{indent}await $("{selector}").click();',
+        "input_text": '{indent}await $("{selector}").setValue("{text}");',
+        "take_screenshot": '{indent}await browser.saveScreenshot("{filename}");',
+    },
+    "selenium_java": {
+        "navigate_to": '{indent}driver.get("{url}");',
+        "click_element": '{indent}driver.findElement(By.xpath("{selector}")).click();',
+        "input_text": '{indent}driver.findElement(By.xpath("{selector}")).sendKeys("{text}");',
+        "take_screenshot": '{indent}((TakesScreenshot) driver).getScreenshotAs(OutputType.FILE);',
+    },
+    "selenium_js": {
+        "navigate_to": '{indent}await driver.get("{url}");',
+        "click_element": '{indent}await driver.findElement(By.xpath("{selector}")).click();',
+        "input_text": '{indent}await driver.findElement(By.xpath("{selector}")).sendKeys("{text}");',
+        "take_screenshot": '{indent}await driver.takeScreenshot();',
+    },
+}
+
+# Element selector per language, filled into {selector} for actions with an element_ref
+REF_SELECTORS = {
+    "selenium_python": "//element[@ref='{ref}']",
+    "robot_framework": 'xpath=//element[@ref="{ref}"]',
+    "playwright": '[ref=\\"{ref}\\"]',
+    "webdriverio": '[ref=\\"{ref}\\"]',
+    "selenium_java": '//element[@ref=\\"{ref}\\"]',
+    "selenium_js": '//element[@ref=\\"{ref}\\"]',
+}
+
+# Escape tables for user-supplied values embedded in generated code (str.translate runs in C)
+STRING_LITERAL_ESCAPE = str.maketrans({'"': '\\"', "\\": "\\\\", "\n": "\\n", "\r": "\\r"})
+ROBOT_ESCAPE = str.maketrans({"\\": "\\\\", "\n": "\\n", "\r": "\\r"})
+
+LANGUAGE_ESCAPES = {
+    "selenium_python": STRING_LITERAL_ESCAPE,
+    "robot_framework": ROBOT_ESCAPE,
+    "playwright": STRING_LITERAL_ESCAPE,
+    "webdriverio": STRING_LITERAL_ESCAPE,
+    "selenium_java": STRING_LITERAL_ESCAPE,
+    "selenium_js": STRING_LITERAL_ESCAPE,
+}
+
+# Recorded params that end up inside string literals in the generated code
+ESCAPED_PARAMS = ("url", "text", "filename")
+
+@lru_cache(maxsize=1024)
+def ref_selector(language: str, ref: str) -> str:
+    """Build the selector for an element ref once; recordings reuse the same refs often."""
+    return REF_SELECTORS[language].format(ref=ref.translate(LANGUAGE_ESCAPES[language]))
+
+# Values used when a recorded action omits a parameter its template needs
+ACTION_DEFAULTS = {
+    "navigate_to": {"url": None},
+    "input_text": {"text": ""},
+    "take_screenshot": {"filename": "screenshot.png"},
+    "wait_for": {"timeout": 10},
+}
+
+# Actions that only render when their params satisfy a condition; others become TODOs
+ACTION_GUARDS = {
+    "click_element": lambda params: params.get("element_ref"),
+    "input_text": lambda params: params.get("element_ref"),
+    "wait_for": lambda params: params.get("condition") == "page_load",
+}
+
+# Placeholder line for actions a language has no template for
+TODO_TEMPLATES = {
+    "selenium_python": "{indent}# TODO: {tool} - {params}",
+    "robot_framework": "{indent}# TODO: {tool} - {params}",
+    "playwright": "{indent}// TODO: {tool} - {params}",
+    "webdriverio": "{indent}// TODO: {tool} - {params}",
+    "selenium_java": "{indent}// TODO: {tool} - {params}",
+    "selenium_js": "{indent}// TODO: {tool} - {params}",
+}
+
+# Generated scripts kept per (history version, format, test name, setup flag)
+SCRIPT_CACHE_SIZE = 32
+
+def write_script(filename: str, data: bytes) -> None:
+    """Write an encoded script to disk in a single unbuffered write."""
+    with open(filename, "wb", buffering=0) as f:
+        f.write(data)
+
+# Shared stand-in for actions recorded without params (read-only, never mutated)
+EMPTY_PARAMS: Dict[str, Any] = {}
+
+def render_action(language: str, action: Dict[str, Any], indent: str = "") -> str:
+    """Render one recorded action as a line of code in the given language."""
+    tool = action.get("tool")
+    params = action.get("params", EMPTY_PARAMS)
+    
+    template = ACTION_TEMPLATES[language].get(tool)
+    guard = ACTION_GUARDS.get(tool)
+    if template is not None and (guard is None or guard(params)):
+        values = dict(ACTION_DEFAULTS.get(tool, ()))
+        values.update(params)
+        values["indent"] = indent
+        escape = LANGUAGE_ESCAPES[language]
+        for name in ESCAPED_PARAMS:
+            value = values.get(name)
+            if isinstance(value, str):
+                values[name] = value.translate(escape)
+        ref = params.get("element_ref")
+        if ref:
+            values["selector"] = ref_selector(language, ref)
+        return template.format_map(values)
+    
+    return TODO_TEMPLATES[language].format_map({"indent": indent, "tool": tool, "params": params})
+
+def compose_script(language: str, actions: List[Dict[str, Any]], indent: str,
+                   header: str = "", footer: str = "", separator: str = "\n") -> str:
+    """Assemble a script: header, one rendered line per action, then footer.
+    
+    Every format shares this skeleton; generators only supply the language and the
+    header/footer text. ``separator`` precedes the first action line (later lines
+    always start on a new line).
+    """
+    buf = io.StringIO()
+    w = buf.write
+    w(header)
+    for action in actions:
+        line = render_action(language, action, indent)
+        if line:
+            w(separator)
+            w(line)
+            separator = "\n"
+    w(footer)
+    return buf.getvalue()
+
+@dataclass(frozen=True)
+class ScriptLayout:
+    """How one format/setup combination wraps the rendered action lines."""
+    language: str
+    indent: str
+    header: str = ""  # Format string over script_names() fields
+    footer: str = ""  # Format string over script_names() fields
+    setup: str = ""  # Static text before the header
+    setup_tail: str = ""  # Static text after the header
+    teardown: str = ""  # Static text before the footer
+    separator: str = "\n"  # Written before the first action line
+
+# Layouts specialized per (format, include_setup), so generation never branches on the flag
+SCRIPT_LAYOUTS = {
+    ("pytest", True): ScriptLayout("selenium_python", INDENT[1], PYTEST_HEADER, setup=PYTEST_SETUP),
+    ("pytest", False): ScriptLayout("selenium_python", INDENT[1], PYTEST_HEADER),
+    ("unittest", True): ScriptLayout("selenium_python", INDENT[2], UNITTEST_HEADER,
+                                     setup=UNITTEST_SETUP, teardown=UNITTEST_TEARDOWN),
+    ("unittest", False): ScriptLayout("selenium_python", INDENT[2], UNITTEST_HEADER),
+    ("selenium_python", True): ScriptLayout("selenium_python", INDENT[1], setup=SELENIUM_PYTHON_SETUP,
+                                            teardown=SELENIUM_PYTHON_TEARDOWN),
+    # Without setup there is no leading block, so the first line gets no separator
+    ("selenium_python", False): ScriptLayout("selenium_python", INDENT[0], separator=""),
+    ("robot_framework", True): ScriptLayout("robot_framework", INDENT[1], ROBOT_FRAMEWORK_HEADER,
+                                            setup=ROBOT_FRAMEWORK_SETUP, teardown=ROBOT_FRAMEWORK_TEARDOWN),
+    ("robot_framework", False): ScriptLayout("robot_framework", INDENT[1], ROBOT_FRAMEWORK_HEADER),
+    ("playwright", True): ScriptLayout("playwright", INDENT[3], PLAYWRIGHT_HEADER, "    asyncio.run({test_name}())",
+                                       setup=PLAYWRIGHT_IMPORTS, setup_tail=PLAYWRIGHT_SETUP,
+                                       teardown=PLAYWRIGHT_TEARDOWN),
+    ("playwright", False): ScriptLayout("playwright", INDENT[1], PLAYWRIGHT_HEADER),
+}
+
+# WebdriverIO, Java and JS scripts always include their setup
+for _format_name, _layout in (
+    ("webdriverio", ScriptLayout("webdriverio", INDENT[2], WEBDRIVERIO_HEADER, teardown=WEBDRIVERIO_TEARDOWN)),
+    ("selenium_java", ScriptLayout("selenium_java", INDENT[3], SELENIUM_JAVA_HEADER,
+                                   setup=SELENIUM_JAVA_IMPORTS, teardown=SELENIUM_JAVA_TEARDOWN)),
+    ("selenium_js", ScriptLayout("selenium_js", INDENT[2], SELENIUM_JS_HEADER,
+                                 "{test_name}().catch(console.error);", teardown=SELENIUM_JS_TEARDOWN)),
+):
+    SCRIPT_LAYOUTS[(_format_name, True)] = SCRIPT_LAYOUTS[(_format_name, False)] = _layout
+del _format_name, _layout
+
+SCRIPT_FORMATS = tuple(dict.fromkeys(format_name for format_name, _ in SCRIPT_LAYOUTS))
+
+def script_names(test_name: str) -> Dict[str, str]:
+    """Derive the name variants the headers/footers refer to."""
+    return {
+        "test_name": test_name,
+        "class_name": "".join(word.capitalize() for word in test_name.split("_")),
+        "title": test_name.replace("_", " ").title(),
+        "spec_title": test_name.replace("_", " "),
+    }
+
+def render_script(layout: ScriptLayout, actions: List[Dict[str, Any]], params: "GenerateScriptParams") -> str:
+    """Generate a whole script for one specialized layout."""
+    names = script_names(params.test_name)
+    header = layout.setup + layout.header.format_map(names) + layout.setup_tail
+    footer = layout.teardown + layout.footer.format_map(names)
+    return compose_script(layout.language, actions, layout.indent, header, footer, layout.separator)
+
+# Generator per (format, include_setup), specialized once at import
+SCRIPT_GENERATORS = {key: partial(render_script, layout) for key, layout in SCRIPT_LAYOUTS.items()}
+
 class GenerateScriptParams(BaseModel):
     """Parameters for script generation."""
     format: str = Field(
@@ -27,6 +444,12 @@ class GenerateScriptParams(BaseModel):
 class GenerateScriptTool(BaseTool):
     """Generate test script from recorded browser actions."""
     
+    SUPPORTED_FORMATS = ", ".join(SCRIPT_FORMATS)
+    
+    def __init__(self):
+        super().__init__()
+        self._script_cache: "OrderedDict[tuple, str]" = OrderedDict()
+    
     def _create_schema(self) -> ToolSchema:
         return ToolSchema(
             name="generate_script",
@@ -44,489 +467,42 @@ class GenerateScriptTool(BaseTool):
                 capture_snapshot=False
             )
         
-        format_handlers = {
-            "pytest": self._generate_pytest,
-            "unittest": self._generate_unittest,
-            "selenium_python": self._generate_selenium_python,
-            "robot_framework": self._generate_robot_framework,
-            "playwright": self._generate_playwright,
-            "webdriverio": self._generate_webdriverio,
-            "selenium_java": self._generate_selenium_java,
-            "selenium_js": self._generate_selenium_js
-        }
-        
-        handler = format_handlers.get(params.format.lower())
-        if not handler:
+        format_name = params.format.lower()
+        generator = SCRIPT_GENERATORS.get((format_name, params.include_setup))
+        if not generator:
             return ToolResult(
-                code=[f"Unsupported format: {params.format}. Choose from: {', '.join(format_handlers.keys())}"],
+                code=[f"Unsupported format: {params.format}. Choose from: {self.SUPPORTED_FORMATS}"],
                 capture_snapshot=False
             )
         
-        script = handler(context.action_history, params)
+        # An unchanged recording exported again (or in another format) is served from
+        # the cache; the history version changes whenever an action is recorded
+        cache_key = (context.history_version, format_name, params.test_name, params.include_setup)
+        script = self._script_cache.get(cache_key)
+        if script is None:
+            script = generator(context.action_history, params)
+            self._script_cache[cache_key] = script
+            if len(self._script_cache) > SCRIPT_CACHE_SIZE:
+                self._script_cache.popitem(last=False)
+        else:
+            self._script_cache.move_to_end(cache_key)
         
         result_lines = [
             f"Generated {params.format} test script from {len(context.action_history)} recorded actions:",
-            "",
-            script
+            ""
         ]
         
-        # Save to file if requested
+        # Save to file if requested; the status line goes just before the script
         if params.filename:
             try:
-                with open(params.filename, 'w') as f:
-                    f.write(script)
-                result_lines.insert(-1, f"Script saved to: {params.filename}")
+                await asyncio.to_thread(write_script, params.filename, script.encode("utf-8"))
+                result_lines.append(f"Script saved to: {params.filename}")
             except Exception as e:
-                result_lines.insert(-1, f"Error saving to {params.filename}: {e}")
+                result_lines.append(f"Error saving to {params.filename}: {e}")
+        
+        result_lines.append(script)
         
         return ToolResult(
             code=result_lines,
             capture_snapshot=False
         )
-    
-    def _generate_pytest(self, actions: List[Dict[str, Any]], params: GenerateScriptParams) -> str:
-        """Generate pytest format test script."""
-        lines = []
-        
-        if params.include_setup:
-            lines.extend([
-                "import pytest",
-                "from selenium import webdriver",
-                "from selenium.webdriver.common.by import By",
-                "from selenium.webdriver.support.ui import WebDriverWait",
-                "from selenium.webdriver.support import expected_conditions as EC",
-                "from selenium.webdriver.common.keys import Keys",
-                "import time",
-                "",
-                "@pytest.fixture",
-                "def driver():",
-                "    driver = webdriver.Chrome()",
-                "    driver.maximize_window()",
-                "    yield driver",
-                "    driver.quit()",
-                "",
-                ""
-            ])
-        
-        lines.extend([
-            f"def {params.test_name}(driver):",
-            "    \"\"\"Auto-generated test from recorded browser actions.\"\"\""
-        ])
-        
-        for action in actions:
-            line = self._action_to_selenium_code(action, indent="    ")
-            if line:
-                lines.append(line)
-        
-        return "\n".join(lines)
-    
-    def _generate_unittest(self, actions: List[Dict[str, Any]], params: GenerateScriptParams) -> str:
-        """Generate unittest format test script."""
-        lines = []
-        
-        if params.include_setup:
-            lines.extend([
-                "import unittest",
-                "from selenium import webdriver",
-                "from selenium.webdriver.common.by import By",
-                "from selenium.webdriver.support.ui import WebDriverWait",
-                "from selenium.webdriver.support import expected_conditions as EC",
-                "from selenium.webdriver.common.keys import Keys",
-                "import time",
-                "",
-                ""
-            ])
-        
-        class_name = "".join(word.capitalize() for word in params.test_name.split("_"))
-        lines.extend([
-            f"class {class_name}(unittest.TestCase):",
-            "    \"\"\"Auto-generated test from recorded browser actions.\"\"\"",
-            "",
-            "    def setUp(self):",
-            "        self.driver = webdriver.Chrome()",
-            "        self.driver.maximize_window()",
-            "",
-            "    def tearDown(self):",
-            "        self.driver.quit()",
-            "",
-            f"    def {params.test_name}(self):",
-            "        driver = self.driver"
-        ])
-        
-        for action in actions:
-            line = self._action_to_selenium_code(action, indent="        ")
-            if line:
-                lines.append(line)
-        
-        if params.include_setup:
-            lines.extend([
-                "",
-                "",
-                "if __name__ == '__main__':",
-                "    unittest.main()"
-            ])
-        
-        return "\n".join(lines)
-    
-    def _generate_selenium_python(self, actions: List[Dict[str, Any]], params: GenerateScriptParams) -> str:
-        """Generate raw Selenium Python script."""
-        lines = []
-        
-        if params.include_setup:
-            lines.extend([
-                "from selenium import webdriver",
-                "from selenium.webdriver.common.by import By",
-                "from selenium.webdriver.support.ui import WebDriverWait",
-                "from selenium.webdriver.support import expected_conditions as EC",
-                "from selenium.webdriver.common.keys import Keys",
-                "import time",
-                "",
-                "# Auto-generated test from recorded browser actions",
-                "driver = webdriver.Chrome()",
-                "driver.maximize_window()",
-                "",
-                "try:"
-            ])
-        
-        for action in actions:
-            line = self._action_to_selenium_code(action, indent="    " if params.include_setup else "")
-            if line:
-                lines.append(line)
-        
-        if params.include_setup:
-            lines.extend([
-                "",
-                "finally:",
-                "    driver.quit()"
-            ])
-        
-        return "\n".join(lines)
-    
-    def _generate_robot_framework(self, actions: List[Dict[str, Any]], params: GenerateScriptParams) -> str:
-        """Generate Robot Framework test script."""
-        lines = []
-        
-        if params.include_setup:
-            lines.extend([
-                "*** Settings ***",
-                "Documentation    Auto-generated test from recorded browser actions",
-                "Library          SeleniumLibrary",
-                "Test Setup       Open Browser To Test Page",
-                "Test Teardown    Close Browser",
-                "",
-                "*** Variables ***",
-                "${BROWSER}        Chrome",
-                "${TIMEOUT}       10s",
-                "",
-                "*** Test Cases ***"
-            ])
-        
-        test_name_display = params.test_name.replace("_", " ").title()
-        lines.extend([
-            f"{test_name_display}",
-            "    [Documentation]    Auto-generated test scenario"
-        ])
-        
-        for action in actions:
-            line = self._action_to_robot_framework(action)
-            if line:
-                lines.append(f"    {line}")
-        
-        if params.include_setup:
-            lines.extend([
-                "",
-                "*** Keywords ***",
-                "Open Browser To Test Page",
-                "    Open Browser    about:blank    ${BROWSER}",
-                "    Maximize Browser Window",
-                "    Set Selenium Timeout    ${TIMEOUT}"
-            ])
-        
-        return "\n".join(lines)
-    
-    def _generate_playwright(self, actions: List[Dict[str, Any]], params: GenerateScriptParams) -> str:
-        """Generate Playwright test script."""
-        lines = []
-        
-        if params.include_setup:
-            lines.extend([
-                "import asyncio",
-                "from playwright.async_api import async_playwright, expect",
-                "",
-                ""
-            ])
-        
-        lines.extend([
-            f"async def {params.test_name}():",
-            "    \"\"\"Auto-generated test from recorded browser actions.\"\"\""
-        ])
-        
-        if params.include_setup:
-            lines.extend([
-                "    async with async_playwright() as p:",
-                "        browser = await p.chromium.launch(headless=False)",
-                "        context = await browser.new_context()",
-                "        page = await context.new_page()",
-                "",
-                "        try:"
-            ])
-        
-        for action in actions:
-            line = self._action_to_playwright(action, indent="            " if params.include_setup else "    ")
-            if line:
-                lines.append(line)
-        
-        if params.include_setup:
-            lines.extend([
-                "",
-                "        finally:",
-                "            await browser.close()",
-                "",
-                "",
-                "if __name__ == '__main__':",
-                f"    asyncio.run({params.test_name}())"
-            ])
-        
-        return "\n".join(lines)
-    
-    def _generate_webdriverio(self, actions: List[Dict[str, Any]], params: GenerateScriptParams) -> str:
-        """Generate WebdriverIO test script."""
-        lines = [
-            "describe('Auto-generated Test Suite', () => {",
-            f"    it('{params.test_name.replace('_', ' ')}', async () => {{",
-            "        // Auto-generated test from recorded browser actions"
-        ]
-        
-        for action in actions:
-            line = self._action_to_webdriverio(action, indent="        ")
-            if line:
-                lines.append(line)
-        
-        lines.extend([
-            "    });",
-            "});"
-        ])
-        
-        return "\n".join(lines)
-    
-    def _generate_selenium_java(self, actions: List[Dict[str, Any]], params: GenerateScriptParams) -> str:
-        """Generate Selenium Java test script."""
-        class_name = "".join(word.capitalize() for word in params.test_name.split("_"))
-        
-        lines = [
-            "import org.openqa.selenium.By;",
-            "import org.openqa.selenium.WebDriver;",
-            "import org.openqa.selenium.WebElement;",
-            "import org.openqa.selenium.chrome.ChromeDriver;",
-            "import org.openqa.selenium.support.ui.WebDriverWait;",
-            "import org.openqa.selenium.support.ui.ExpectedConditions;",
-            "import java.time.Duration;",
-            "",
-            f"public class {class_name} {{",
-            "    // Auto-generated test from recorded browser actions",
-            "    public static void main(String[] args) {",
-            "        WebDriver driver = new ChromeDriver();",
-            "        WebDriverWait wait = new WebDriverWait(driver, Duration.ofSeconds(10));",
-            "        ",
-            "        try {"
-        ]
-        
-        for action in actions:
-            line = self._action_to_selenium_java(action, indent="            ")
-            if line:
-                lines.append(line)
-        
-        lines.extend([
-            "        } finally {",
-            "            driver.quit();",
-            "        }",
-            "    }",
-            "}"
-        ])
-        
-        return "\n".join(lines)
-    
-    def _generate_selenium_js(self, actions: List[Dict[str, Any]], params: GenerateScriptParams) -> str:
-        """Generate Selenium JavaScript test script."""
-        lines = [
-            "const { Builder, By, until } = require('selenium-webdriver');",
-            "",
-            f"async function {params.test_name}() {{",
-            "    // Auto-generated test from recorded browser actions",
-            "    let driver = await new Builder().forBrowser('chrome').build();",
-            "    ",
-            "    try {"
-        ]
-        
-        for action in actions:
-            line = self._action_to_selenium_js(action, indent="        ")
-            if line:
-                lines.append(line)
-        
-        lines.extend([
-            "    } finally {",
-            "        await driver.quit();",
-            "    }",
-            "}",
-            "",
-            f"{params.test_name}().catch(console.error);"
-        ])
-        
-        return "\n".join(lines)
-    
-    # Helper methods to convert actions to different code formats
-    def _action_to_selenium_code(self, action: Dict[str, Any], indent: str = "") -> str:
-        """Convert an action to Selenium Python code."""
-        tool = action.get("tool")
-        params = action.get("params", {})
-        
-        if tool == "navigate_to":
-            return f'{indent}driver.get("{params.get("url")}")'
-        
-        elif tool == "click_element":
-            ref = params.get("element_ref")
-            if ref:
-                return f'{indent}driver.find_element(By.XPATH, "//element[@ref=\'{ref}\']").click()'
-        
-        elif tool == "input_text":
-            ref = params.get("element_ref")
-            text = params.get("text", "")
-            if ref:
-                return f'{indent}driver.find_element(By.XPATH, "//element[@ref=\'{ref}\']").send_keys("{text}")'
-        
-        elif tool == "take_screenshot":
-            filename = params.get("filename", "screenshot.png")
-            return f'{indent}driver.save_screenshot("{filename}")'
-        
-        elif tool == "wait_for":
-            condition = params.get("condition")
-            timeout = params.get("timeout", 10)
-            if condition == "page_load":
-                return f'{indent}WebDriverWait(driver, {timeout}).until(lambda d: d.execute_script("return document.readyState") == "complete")'
-        
-        return f'{indent}# TODO: {tool} - {params}'
-    
-    def _action_to_robot_framework(self, action: Dict[str, Any]) -> str:
-        """Convert an action to Robot Framework keyword."""
-        tool = action.get("tool")
-        params = action.get("params", {})
-        
-        if tool == "navigate_to":
-            return f'Go To    {params.get("url")}'
-        
-        elif tool == "click_element":
-            ref = params.get("element_ref")
-            if ref:
-                return f'Click Element    xpath=//element[@ref="{ref}"]'
-        
-        elif tool == "input_text":
-            ref = params.get("element_ref")
-            text = params.get("text", "")
-            if ref:
-                return f'Input Text    xpath=//element[@ref="{ref}"]    {text}'
-        
-        elif tool == "take_screenshot":
-            filename = params.get("filename", "screenshot.png")
-            return f'Capture Page Screenshot    {filename}'
-        
-        return f'# TODO: {tool} - {params}'
-    
-    def _action_to_playwright(self, action: Dict[str, Any], indent: str = "") -> str:
-        """Convert an action to Playwright code."""
-        tool = action.get("tool")
-        params = action.get("params", {})
-        
-        if tool == "navigate_to":
-            return f'{indent}await page.goto("{params.get("url")}")'
-        
-        elif tool == "click_element":
-            ref = params.get("element_ref")
-            if ref:
-                return f'{indent}await page.click("[ref=\\"{ref}\\"]")'
-        
-        elif tool == "input_text":
-            ref = params.get("element_ref")
-            text = params.get("text", "")
-            if ref:
-                return f'{indent}await page.fill("[ref=\\"{ref}\\"]", "{text}")'
-        
-        elif tool == "take_screenshot":
-            filename = params.get("filename", "screenshot.png")
-            return f'{indent}await page.screenshot(path="{filename}")'
-        
-        return f'{indent}// TODO: {tool} - {params}'
-    
-    def _action_to_webdriverio(self, action: Dict[str, Any], indent: str = "") -> str:
-        """Convert an action to WebdriverIO code."""
-        tool = action.get("tool")
-        params = action.get("params", {})
-        
-        if tool == "navigate_to":
-            return f'{indent}await browser.url("{params.get("url")}");'
-        
-        elif tool == "click_element":
-            ref = params.get("element_ref")
-            if ref:
-                return f'{indent}await $("[ref=\\"{ref}\\"]").click();'
-        
-        elif tool == "input_text":
-            ref = params.get("element_ref")
-            text = params.get("text", "")
-            if ref:
-                return f'{indent}await $("[ref=\\"{ref}\\"]").setValue("{text}");'
-        
-        elif tool == "take_screenshot":
-            filename = params.get("filename", "screenshot.png")
-            return f'{indent}await browser.saveScreenshot("{filename}");'
-        
-        return f'{indent}// TODO: {tool} - {params}'
-    
-    def _action_to_selenium_java(self, action: Dict[str, Any], indent: str = "") -> str:
-        """Convert an action to Selenium Java code."""
-        tool = action.get("tool")
-        params = action.get("params", {})
-        
-        if tool == "navigate_to":
-            return f'{indent}driver.get("{params.get("url")}");'
-        
-        elif tool == "click_element":
-            ref = params.get("element_ref")
-            if ref:
-                return f'{indent}driver.findElement(By.xpath("//element[@ref=\\"{ref}\\"]")).click();'
-        
-        elif tool == "input_text":
-            ref = params.get("element_ref")
-            text = params.get("text", "")
-            if ref:
-                return f'{indent}driver.findElement(By.xpath("//element[@ref=\\"{ref}\\"]")).sendKeys("{text}");'
-        
-        elif tool == "take_screenshot":
-            filename = params.get("filename", "screenshot.png")
-            return f'{indent}((TakesScreenshot) driver).getScreenshotAs(OutputType.FILE);'
-        
-        return f'{indent}// TODO: {tool} - {params}'
-    
-    def _action_to_selenium_js(self, action: Dict[str, Any], indent: str = "") -> str:
-        """Convert an action to Selenium JavaScript code."""
-        tool = action.get("tool")
-        params = action.get("params", {})
-        
-        if tool == "navigate_to":
-            return f'{indent}await driver.get("{params.get("url")}");'
-        
-        elif tool == "click_element":
-            ref = params.get("element_ref")
-            if ref:
-                return f'{indent}await driver.findElement(By.xpath("//element[@ref=\\"{ref}\\"]")).click();'
-        
-        elif tool == "input_text":
-            ref = params.get("element_ref")
-            text = params.get("text", "")
-            if ref:
-                return f'{indent}await driver.findElement(By.xpath("//element[@ref=\\"{ref}\\"]")).sendKeys("{text}");'
-        
-        elif tool == "take_screenshot":
-            filename = params.get("filename", "screenshot.png")
-            return f'{indent}await driver.takeScreenshot();'
-        
-        return f'{indent}// TODO: {tool} - {params}'
\ No newline at end of file
@@ -2,20 +2,249 @@
 
 import json
 import logging
-from typing import List, Dict, Any, Optional
+from pathlib import Path
+from functools import lru_cache, partial
+from typing import List, Dict, Any, NamedTuple, Optional
 from pydantic import BaseModel, Field
 from selenium_mcp.tool_base import BaseTool, ToolSchema
-from selenium_mcp.context import Context, ToolResult
+from selenium_mcp.context import Context, PageSnapshot, ToolResult
 
 logger = logging.getLogger(__name__)
 
 # Tools that should not generate test code (meta-tools)
-META_TOOLS = {
+META_TOOLS = frozenset({
     "capture_page", "generator_read_log", "generate_script",
     "start_recording", "stop_recording", "recording_status",
     "planner_setup_page", "planner_save_plan", "generator_setup_page"
+})
+
+# Canned rejections; nothing mutates a returned ToolResult, so these are shared
+EMPTY_HISTORY_RESULT = ToolResult(
+    code=("No actions recorded. Start recording first with start_recording tool.",),
+    capture_snapshot=False
+)
+EMPTY_FILTERED_RESULT = ToolResult(
+    code=("No testable actions recorded. Only meta-tools were used.",),
+    capture_snapshot=False
+)
+
+# Characters written per slice when saving a generated script
+SAVE_CHUNK_SIZE = 1 << 16
+
+# Import lines shared by the pytest, unittest and plain Selenium formats
+SELENIUM_IMPORTS = (
+    "from selenium import webdriver",
+    "from selenium.webdriver.common.by import By",
+    "from selenium.webdriver.support.ui import WebDriverWait",
+    "from selenium.webdriver.support import expected_conditions as EC",
+    "from selenium.webdriver.support.select import Select",
+)
+
+# Backslash-escape values interpolated into generated string literals: quotes,
+# backslashes and line breaks (which would otherwise end the literal)
+QUOTE_ESCAPE = str.maketrans({'"': '\\"', "'": "\\'", "\\": "\\\\", "\n": "\\n", "\r": "\\r"})
+
+# Per-action Selenium Python blocks; {indent} is baked in per nesting level by
+# action_templates(), the remaining fields are filled with format_map per action.
+NAVIGATE_TEMPLATE = (
+    "{indent}# Navigate to {url}\n"
+    "{indent}driver.get(\"{quoted_url}\")\n"
+    "{indent}time.sleep(1)  # Wait for page load"
+)
+CLICK_TEMPLATE = (
+    "{indent}# Click: {desc}\n"
+    "{indent}element = WebDriverWait(driver, 10).until(\n"
+    "{indent}    EC.element_to_be_clickable(({by}, \"{value}\"))\n"
+    "{indent})\n"
+    "{indent}element.click()"
+)
+INPUT_TEMPLATE = (
+    "{indent}# Type into: {desc}\n"
+    "{indent}input_field = WebDriverWait(driver, 10).until(\n"
+    "{indent}    EC.presence_of_element_located(({by}, \"{value}\"))\n"
+    "{indent})\n"
+    "{indent}input_field.clear()\n"
+    "{indent}input_field.send_keys(\"{text}\")"
+)
+VERIFY_TEXT_TEMPLATE = (
+    "{indent}# Verify text is visible: '{text}'\n"
+    "{indent}WebDriverWait(driver, 10).until(\n"
+    "{indent}    EC.visibility_of_element_located((By.XPATH, \"//*[contains(text(), '{escaped_text}')]\"))\n"
+    "{indent})"
+)
+SELECT_TEMPLATE = (
+    "{indent}# Select option: {value} from {desc}\n"
+    "{indent}select_element = WebDriverWait(driver, 10).until(\n"
+    "{indent}    EC.presence_of_element_located((By.TAG_NAME, \"select\"))\n"
+    "{indent})\n"
+    "{indent}select = Select(select_element)\n"
+    "{indent}select.select_by_visible_text(\"{value}\")"
+)
+WAIT_PAGE_LOAD_TEMPLATE = (
+    "{indent}# Wait for page to load\n"
+    "{indent}WebDriverWait(driver, {timeout}).until(\n"
+    "{indent}    lambda d: d.execute_script(\"return document.readyState\") == \"complete\"\n"
+    "{indent})"
+)
+SCREENSHOT_TEMPLATE = (
+    "{indent}# Take screenshot\n"
+    "{indent}driver.save_screenshot(\"{filename}\")"
+)
+HOVER_TEMPLATE = (
+    "{indent}# Hover over: {desc}\n"
+    "{indent}from selenium.webdriver.common.action_chains import ActionChains\n"
+    "{indent}element = WebDriverWait(driver, 10).until(\n"
+    "{indent}    EC.presence_of_element_located((By.XPATH, \"//*[contains(text(), '{search_text}')]\"))\n"
+    "{indent})\n"
+    "{indent}ActionChains(driver).move_to_element(element).perform()"
+)
+
+class ActionTemplates(NamedTuple):
+    """Action templates with the indent of one nesting level filled in."""
+    navigate: str
+    click: str
+    input: str
+    verify_text: str
+    select: str
+    wait_page_load: str
+    screenshot: str
+    hover: str
+
+@lru_cache(maxsize=8)
+def action_templates(indent: str) -> ActionTemplates:
+    """Bake an indent into the action templates once; generators only use a couple of indents."""
+    return ActionTemplates(*(template.replace("{indent}", indent) for template in (
+        NAVIGATE_TEMPLATE,
+        CLICK_TEMPLATE,
+        INPUT_TEMPLATE,
+        VERIFY_TEXT_TEMPLATE,
+        SELECT_TEMPLATE,
+        WAIT_PAGE_LOAD_TEMPLATE,
+        SCREENSHOT_TEMPLATE,
+        HOVER_TEMPLATE,
+    )))
+
+PYTEST_SETUP = "\n".join((
+    "\"\"\"Auto-generated test from Selenium MCP recorded actions.\"\"\"",
+    "",
+    "import pytest",
+    *SELENIUM_IMPORTS,
+    "from selenium.webdriver.common.keys import Keys",
+    "import time",
+    "",
+    "",
+    "@pytest.fixture",
+    "def driver():",
+    "    \"\"\"Setup and teardown for Chrome WebDriver.\"\"\"",
+    "    driver = webdriver.Chrome()",
+    "    driver.maximize_window()",
+    "    driver.implicitly_wait(10)",
+    "    yield driver",
+    "    driver.quit()",
+    "",
+    "",
+))
+PYTEST_HEADER = "\n".join((
+    "def {test_name}(driver):",
+    "    \"\"\"Auto-generated test from recorded browser actions.\"\"\"",
+))
+UNITTEST_HEADER = "\n".join((
+    "\"\"\"Auto-generated test from Selenium MCP recorded actions.\"\"\"",
+    "",
+    "import unittest",
+    *SELENIUM_IMPORTS,
+    "import time",
+    "",
+    "",
+    "class {class_name}(unittest.TestCase):",
+    "    \"\"\"Auto-generated test from recorded browser actions.\"\"\"",
+    "",
+    "    def setUp(self):",
+    "        self.driver = webdriver.Chrome()",
+    "        self.driver.maximize_window()",
+    "        self.driver.implicitly_wait(10)",
+    "",
+    "    def tearDown(self):",
+    "        self.driver.quit()",
+    "",
+    "    def {test_name}(self):",
+    "        driver = self.driver",
+))
+UNITTEST_FOOTER = "\n".join((
+    "",
+    "",
+    "",
+    "if __name__ == '__main__':",
+    "    unittest.main()",
+))
+SELENIUM_PYTHON_HEADER = "\n".join((
+    "\"\"\"Auto-generated test from Selenium MCP recorded actions.\"\"\"",
+    "",
+    *SELENIUM_IMPORTS,
+    "import time",
+    "",
+    "# Initialize browser",
+    "driver = webdriver.Chrome()",
+    "driver.maximize_window()",
+    "driver.implicitly_wait(10)",
+    "",
+    "try:",
+))
+SELENIUM_PYTHON_FOOTER = "\n".join((
+    "",
+    "",
+    "finally:",
+    "    driver.quit()",
+))
+
+ROBOT_FRAMEWORK_HEADER = "\n".join((
+    "*** Settings ***",
+    "Documentation    Auto-generated test from Selenium MCP recorded actions",
+    "Library          SeleniumLibrary",
+    "Test Setup       Open Browser To Test Page",
+    "Test Teardown    Close Browser",
+    "",
+    "*** Variables ***",
+    "${BROWSER}        Chrome",
+    "${TIMEOUT}       10s",
+    "",
+    "*** Test Cases ***",
+))
+ROBOT_FRAMEWORK_FOOTER = "\n".join((
+    "",
+    "*** Keywords ***",
+    "Open Browser To Test Page",
+    "    Open Browser    about:blank    ${BROWSER}",
+    "    Maximize Browser Window",
+    "    Set Selenium Timeout    ${TIMEOUT}",
+))
+
+class SeleniumLayout(NamedTuple):
+    """Fixed parts of a Selenium Python script; only the action body varies per call."""
+    indent: str
+    header: str
+    footer: str = ""
+
+# (format, include_setup) -> layout, so each generation is a header fill plus the body
+SELENIUM_LAYOUTS = {
+    ("pytest", True): SeleniumLayout("    ", PYTEST_SETUP + "\n" + PYTEST_HEADER),
+    ("pytest", False): SeleniumLayout("    ", PYTEST_HEADER),
+    ("unittest", True): SeleniumLayout("        ", UNITTEST_HEADER, UNITTEST_FOOTER),
+    ("unittest", False): SeleniumLayout("        ", UNITTEST_HEADER, UNITTEST_FOOTER),
+    ("selenium_python", True): SeleniumLayout("    ", SELENIUM_PYTHON_HEADER, SELENIUM_PYTHON_FOOTER),
+    ("selenium_python", False): SeleniumLayout("    ", SELENIUM_PYTHON_HEADER, SELENIUM_PYTHON_FOOTER),
 }
 
+def render_selenium(layout: SeleniumLayout, tool: "ImprovedGenerateScriptTool", actions: List[Dict[str, Any]],
+                    params: "GenerateScriptParams", context: Context) -> str:
+    """Generate a pytest, unittest or plain Selenium script from its layout."""
+    header = layout.header.format_map({
+        "test_name": params.test_name,
+        "class_name": "".join(word.capitalize() for word in params.test_name.split("_")),
+    })
+    body = "\n".join(tool._selenium_body(actions, layout.indent, context))
+    return f"{header}\n{body}{layout.footer}"
+
 class GenerateScriptParams(BaseModel):
     """Parameters for script generation."""
     format: str = Field(
@@ -49,431 +278,257 @@ class ImprovedGenerateScriptTool(BaseTool):
         """Generate test script from recorded actions."""
 
         if not context.action_history:
-            return ToolResult(
-                code=["No actions recorded. Start recording first with start_recording tool."],
-                capture_snapshot=False
-            )
+            return EMPTY_HISTORY_RESULT
 
         # Filter out meta-tools that shouldn't appear in generated tests
         filtered_actions = [
             action for action in context.action_history
-            if action.get("tool") not in META_TOOLS
+            if action["tool"] not in META_TOOLS
         ]
 
         if not filtered_actions:
-            return ToolResult(
-                code=["No testable actions recorded. Only meta-tools were used."],
-                capture_snapshot=False
-            )
-
-        format_handlers = {
-            "pytest": self._generate_pytest,
-            "unittest": self._generate_unittest,
-            "selenium_python": self._generate_selenium_python,
-            "robot_framework": self._generate_robot_framework,
-        }
+            return EMPTY_FILTERED_RESULT
 
-        handler = format_handlers.get(params.format.lower())
+        handler = self.FORMAT_HANDLERS.get((params.format.lower(), params.include_setup))
         if not handler:
             return ToolResult(
-                code=[f"Unsupported format: {params.format}. Choose from: {', '.join(format_handlers.keys())}"],
+                code=[f"Unsupported format: {params.format}. Choose from: {self.SUPPORTED_FORMATS}"],
                 capture_snapshot=False
             )
 
-        script = handler(filtered_actions, params, context)
+        script = handler(self, filtered_actions, params, context)
 
         result_lines = [
             f"✅ Generated {params.format} test script from {len(filtered_actions)} recorded actions",
             f"   (Filtered out {len(context.action_history) - len(filtered_actions)} meta-tools)",
             "",
             "Generated code:",
-            "",
-            script
+            ""
         ]
 
-        # Save to file if requested
+        # Save to file if requested; the status line goes just before the script
         if params.filename:
             try:
-                from pathlib import Path
                 filepath = Path(params.filename)
-                filepath.parent.mkdir(parents=True, exist_ok=True)
-                filepath.write_text(script)
-                result_lines.insert(-1, f"✅ Script saved to: {params.filename}")
+                # Bare filenames land in the cwd; skip the mkdir syscalls for them
+                if filepath.parent != Path("."):
+                    filepath.parent.mkdir(parents=True, exist_ok=True)
+                # Encode through the text layer in slices so a long script never
+                # exists twice (str + bytes) in memory
+                with filepath.open("w", encoding="utf-8", newline="\n") as f:
+                    for start in range(0, len(script), SAVE_CHUNK_SIZE):
+                        f.write(script[start:start + SAVE_CHUNK_SIZE])
+                result_lines.append(f"✅ Script saved to: {params.filename}")
                 logger.info(f"📝 Test script saved to: {params.filename}")
             except Exception as e:
-                result_lines.insert(-1, f"❌ Error saving to {params.filename}: {e}")
+                result_lines.append(f"❌ Error saving to {params.filename}: {e}")
                 logger.error(f"Failed to save script: {e}")
 
+        result_lines.append(script)
+
         return ToolResult(
             code=result_lines,
             capture_snapshot=False
         )
 
-    def _generate_pytest(self, actions: List[Dict[str, Any]], params: GenerateScriptParams, context: Context) -> str:
-        """Generate pytest format test script."""
-        lines = []
-
-        if params.include_setup:
-            lines.extend([
-                "\"\"\"Auto-generated test from Selenium MCP recorded actions.\"\"\"",
-                "",
-                "import pytest",
-                "from selenium import webdriver",
-                "from selenium.webdriver.common.by import By",
-                "from selenium.webdriver.support.ui import WebDriverWait",
-                "from selenium.webdriver.support import expected_conditions as EC",
-                "from selenium.webdriver.support.select import Select",
-                "from selenium.webdriver.common.keys import Keys",
-                "import time",
-                "",
-                "",
-                "@pytest.fixture",
-                "def driver():",
-                "    \"\"\"Setup and teardown for Chrome WebDriver.\"\"\"",
-                "    driver = webdriver.Chrome()",
-                "    driver.maximize_window()",
-                "    driver.implicitly_wait(10)",
-                "    yield driver",
-                "    driver.quit()",
-                "",
-                ""
-            ])
-
-        lines.extend([
-            f"def {params.test_name}(driver):",
-            "    \"\"\"Auto-generated test from recorded browser actions.\"\"\""
-        ])
-
-        # Generate code for each action
-        has_content = False
+    def _generate_robot_framework(self, actions: List[Dict[str, Any]], params: GenerateScriptParams, context: Context) -> str:
+        """Generate Robot Framework test script."""
+        test_name_display = params.test_name.replace("_", " ").title()
+        lines = [
+            ROBOT_FRAMEWORK_HEADER,
+            test_name_display,
+            "    [Documentation]    Auto-generated test scenario"
+        ]
+
+        convert = self._action_to_robot_framework
+        append = lines.append
         for action in actions:
-            code_lines = self._action_to_selenium_code(action, indent="    ", context=context)
-            if code_lines:
-                if isinstance(code_lines, list):
-                    lines.extend(code_lines)
-                else:
-                    lines.append(code_lines)
-                has_content = True
+            append("    " + convert(action, context=context))
 
-        if not has_content:
-            lines.append("    pass  # No actions generated")
+        append(ROBOT_FRAMEWORK_FOOTER)
 
         return "\n".join(lines)
 
-    def _generate_unittest(self, actions: List[Dict[str, Any]], params: GenerateScriptParams, context: Context) -> str:
-        """Generate unittest format test script."""
-        lines = [
-            "\"\"\"Auto-generated test from Selenium MCP recorded actions.\"\"\"",
-            "",
-            "import unittest",
-            "from selenium import webdriver",
-            "from selenium.webdriver.common.by import By",
-            "from selenium.webdriver.support.ui import WebDriverWait",
-            "from selenium.webdriver.support import expected_conditions as EC",
-            "from selenium.webdriver.support.select import Select",
-            "import time",
-            "",
-            ""
-        ]
+    # (format, include_setup) -> generator, specialized once when the class is defined
+    FORMAT_HANDLERS = {
+        **{key: partial(render_selenium, layout) for key, layout in SELENIUM_LAYOUTS.items()},
+        ("robot_framework", True): _generate_robot_framework,
+        ("robot_framework", False): _generate_robot_framework,
+    }
+    SUPPORTED_FORMATS = ", ".join(dict.fromkeys(format_name for format_name, _ in FORMAT_HANDLERS))
+
+    def _selenium_body(self, actions: List[Dict[str, Any]], indent: str, context: Context) -> List[str]:
+        """Render the test body shared by the pytest, unittest and plain Selenium formats."""
+        convert = self._action_to_selenium_code
+        snapshot = context.current_snapshot if context else None
+        # Refs resolved once per generation; the same element is often used by several actions
+        locators: Dict[str, tuple] = {}
+        # One pre-joined block per action keeps the final join over few items
+        body = [convert(action, indent, snapshot, locators) for action in actions]
+
+        return body or [f"{indent}pass  # No actions generated"]
+
+    def _emit_navigate(self, params: Dict[str, Any], indent: str, snapshot: Optional[PageSnapshot], locators: Dict[str, tuple]) -> Optional[str]:
+        url = params.get("url")
+        if url:
+            return action_templates(indent).navigate.format_map(
+                {"url": url, "quoted_url": url.translate(QUOTE_ESCAPE)}
+            )
 
-        class_name = "".join(word.capitalize() for word in params.test_name.split("_"))
-        lines.extend([
-            f"class {class_name}(unittest.TestCase):",
-            "    \"\"\"Auto-generated test from recorded browser actions.\"\"\"",
-            "",
-            "    def setUp(self):",
-            "        self.driver = webdriver.Chrome()",
-            "        self.driver.maximize_window()",
-            "        self.driver.implicitly_wait(10)",
-            "",
-            "    def tearDown(self):",
-            "        self.driver.quit()",
-            "",
-            f"    def {params.test_name}(self):",
-            "        driver = self.driver"
-        ])
+    def _emit_click(self, params: Dict[str, Any], indent: str, snapshot: Optional[PageSnapshot], locators: Dict[str, tuple]) -> Optional[str]:
+        ref = params.get("ref")
+        element_desc = params.get("element", "element")
 
-        has_content = False
-        for action in actions:
-            code_lines = self._action_to_selenium_code(action, indent="        ", context=context)
-            if code_lines:
-                if isinstance(code_lines, list):
-                    lines.extend(code_lines)
-                else:
-                    lines.append(code_lines)
-                has_content = True
-
-        if not has_content:
-            lines.append("        pass  # No actions generated")
-
-        lines.extend([
-            "",
-            "",
-            "if __name__ == '__main__':",
-            "    unittest.main()"
-        ])
+        # Try to get better locator from the page snapshot
+        locator_strategy = self._get_locator_for_ref(ref, snapshot, locators)
 
-        return "\n".join(lines)
+        if locator_strategy:
+            by, locator_value = locator_strategy
+            by_str = f"By.{by}" if hasattr(by, '__name__') else str(by)
+        else:
+            # Fallback: try to extract text from element description
+            search_text = element_desc.partition(" ")[0] or "element"
+            by_str, locator_value = "By.XPATH", f"//*[contains(text(), '{search_text}')]"
 
-    def _generate_selenium_python(self, actions: List[Dict[str, Any]], params: GenerateScriptParams, context: Context) -> str:
-        """Generate raw Selenium Python script."""
-        lines = [
-            "\"\"\"Auto-generated test from Selenium MCP recorded actions.\"\"\"",
-            "",
-            "from selenium import webdriver",
-            "from selenium.webdriver.common.by import By",
-            "from selenium.webdriver.support.ui import WebDriverWait",
-            "from selenium.webdriver.support import expected_conditions as EC",
-            "from selenium.webdriver.support.select import Select",
-            "import time",
-            "",
-            "# Initialize browser",
-            "driver = webdriver.Chrome()",
-            "driver.maximize_window()",
-            "driver.implicitly_wait(10)",
-            "",
-            "try:"
-        ]
+        return action_templates(indent).click.format_map(
+            {"desc": element_desc, "by": by_str, "value": locator_value}
+        )
 
-        has_content = False
-        for action in actions:
-            code_lines = self._action_to_selenium_code(action, indent="    ", context=context)
-            if code_lines:
-                if isinstance(code_lines, list):
-                    lines.extend(code_lines)
-                else:
-                    lines.append(code_lines)
-                has_content = True
-
-        if not has_content:
-            lines.append("    pass  # No actions generated")
-
-        lines.extend([
-            "",
-            "finally:",
-            "    driver.quit()"
-        ])
+    def _emit_input(self, params: Dict[str, Any], indent: str, snapshot: Optional[PageSnapshot], locators: Dict[str, tuple]) -> Optional[str]:
+        ref = params.get("ref")
+        text = params.get("text", "")
+        element_desc = params.get("element", "input field")
 
-        return "\n".join(lines)
+        if not text:
+            return None
 
-    def _generate_robot_framework(self, actions: List[Dict[str, Any]], params: GenerateScriptParams, context: Context) -> str:
-        """Generate Robot Framework test script."""
-        lines = [
-            "*** Settings ***",
-            "Documentation    Auto-generated test from Selenium MCP recorded actions",
-            "Library          SeleniumLibrary",
-            "Test Setup       Open Browser To Test Page",
-            "Test Teardown    Close Browser",
-            "",
-            "*** Variables ***",
-            "${BROWSER}        Chrome",
-            "${TIMEOUT}       10s",
-            "",
-            "*** Test Cases ***"
-        ]
+        locator_strategy = self._get_locator_for_ref(ref, snapshot, locators)
 
-        test_name_display = params.test_name.replace("_", " ").title()
-        lines.extend([
-            f"{test_name_display}",
-            "    [Documentation]    Auto-generated test scenario"
-        ])
+        if locator_strategy:
+            by, locator_value = locator_strategy
+            by_str = f"By.{by}" if hasattr(by, '__name__') else str(by)
+        else:
+            by_str, locator_value = "By.XPATH", "//input"
 
-        for action in actions:
-            code_line = self._action_to_robot_framework(action, context=context)
-            if code_line:
-                lines.append(f"    {code_line}")
+        return action_templates(indent).input.format_map(
+            {"desc": element_desc, "by": by_str, "value": locator_value, "text": text.translate(QUOTE_ESCAPE)}
+        )
 
-        lines.extend([
-            "",
-            "*** Keywords ***",
-            "Open Browser To Test Page",
-            "    Open Browser    about:blank    ${BROWSER}",
-            "    Maximize Browser Window",
-            "    Set Selenium Timeout    ${TIMEOUT}"
-        ])
+    def _emit_verify_text(self, params: Dict[str, Any], indent: str, snapshot: Optional[PageSnapshot], locators: Dict[str, tuple]) -> Optional[str]:
+        text = params.get("text", "")
+        if text:
+            return action_templates(indent).verify_text.format_map(
+                {"text": text.replace("\n", " ").replace("\r", " "), "escaped_text": text.translate(QUOTE_ESCAPE)}
+            )
 
-        return "\n".join(lines)
+    def _emit_select(self, params: Dict[str, Any], indent: str, snapshot: Optional[PageSnapshot], locators: Dict[str, tuple]) -> Optional[str]:
+        values = params.get("values", [])
+        element_desc = params.get("element", "dropdown")
+
+        if values:
+            value = values[0] if isinstance(values, list) else values
+            return action_templates(indent).select.format_map({"value": value, "desc": element_desc})
 
-    def _action_to_selenium_code(self, action: Dict[str, Any], indent: str = "", context: Context = None) -> Any:
-        """Convert an action to Selenium Python code - IMPROVED VERSION."""
+    def _emit_wait(self, params: Dict[str, Any], indent: str, snapshot: Optional[PageSnapshot], locators: Dict[str, tuple]) -> Optional[str]:
+        if params.get("condition") == "page_load":
+            return action_templates(indent).wait_page_load.format_map({"timeout": params.get("timeout", 10)})
+
+    def _emit_screenshot(self, params: Dict[str, Any], indent: str, snapshot: Optional[PageSnapshot], locators: Dict[str, tuple]) -> Optional[str]:
+        filename = params.get("filename", "screenshot.png")
+        return action_templates(indent).screenshot.format_map({"filename": filename.translate(QUOTE_ESCAPE)})
+
+    def _emit_hover(self, params: Dict[str, Any], indent: str, snapshot: Optional[PageSnapshot], locators: Dict[str, tuple]) -> Optional[str]:
+        element_desc = params.get("element", "element")
+        return action_templates(indent).hover.format_map(
+            {"desc": element_desc, "search_text": element_desc.partition(" ")[0] or "element"}
+        )
+
+    # Tool name -> Selenium Python emitter. An emitter returning None falls
+    # through to the TODO placeholder, same as an unknown tool.
+    TOOL_HANDLERS = {
+        "navigate_to": _emit_navigate,
+        "click_element": _emit_click,
+        "input_text": _emit_input,
+        "browser_verify_text_visible": _emit_verify_text,
+        "select_option": _emit_select,
+        "wait_for": _emit_wait,
+        "take_screenshot": _emit_screenshot,
+        "hover_element": _emit_hover,
+    }
+
+    def _action_to_selenium_code(self, action: Dict[str, Any], indent: str = "", snapshot: Optional[PageSnapshot] = None,
+                                 locators: Optional[Dict[str, tuple]] = None) -> str:
+        """Convert an action to a block of Selenium Python code - IMPROVED VERSION."""
         tool = action.get("tool")
         params = action.get("params", {})
 
-        logger.debug(f"Generating code for tool: {tool}, params: {params}")
-
-        # Navigate
-        if tool == "navigate_to":
-            url = params.get("url")
-            if url:
-                return [
-                    f"{indent}# Navigate to {url}",
-                    f'{indent}driver.get("{url}")',
-                    f"{indent}time.sleep(1)  # Wait for page load"
-                ]
-
-        # Click element
-        elif tool == "click_element":
-            ref = params.get("ref")
-            element_desc = params.get("element", "element")
-
-            # Try to get better locator from context snapshot
-            locator_strategy = self._get_locator_for_ref(ref, context)
-
-            if locator_strategy:
-                by, locator_value = locator_strategy
-                by_str = f"By.{by}" if hasattr(by, '__name__') else str(by)
-
-                return [
-                    f"{indent}# Click: {element_desc}",
-                    f"{indent}element = WebDriverWait(driver, 10).until(",
-                    f'{indent}    EC.element_to_be_clickable(({by_str}, "{locator_value}"))',
-                    f"{indent})",
-                    f"{indent}element.click()"
-                ]
-            else:
-                # Fallback: try to extract text from element description
-                search_text = element_desc.split()[0] if element_desc else "element"
-                return [
-                    f"{indent}# Click: {element_desc}",
-                    f"{indent}element = WebDriverWait(driver, 10).until(",
-                    f'{indent}    EC.element_to_be_clickable((By.XPATH, "//*[contains(text(), \'{search_text}\')]"))',
-                    f"{indent})",
-                    f"{indent}element.click()"
-                ]
-
-        # Input text
-        elif tool == "input_text":
-            ref = params.get("ref")
-            text = params.get("text", "")
-            element_desc = params.get("element", "input field")
-
-            if text:
-                locator_strategy = self._get_locator_for_ref(ref, context)
-
-                if locator_strategy:
-                    by, locator_value = locator_strategy
-                    by_str = f"By.{by}" if hasattr(by, '__name__') else str(by)
-
-                    return [
-                        f"{indent}# Type into: {element_desc}",
-                        f"{indent}input_field = WebDriverWait(driver, 10).until(",
-                        f'{indent}    EC.presence_of_element_located(({by_str}, "{locator_value}"))',
-                        f"{indent})",
-                        f"{indent}input_field.clear()",
-                        f'{indent}input_field.send_keys("{text}")'
-                    ]
-                else:
-                    return [
-                        f"{indent}# Type into: {element_desc}",
-                        f"{indent}input_field = WebDriverWait(driver, 10).until(",
-                        f'{indent}    EC.presence_of_element_located((By.XPATH, "//input"))',
-                        f"{indent})",
-                        f"{indent}input_field.clear()",
-                        f'{indent}input_field.send_keys("{text}")'
-                    ]
-
-        # Verify text visible
-        elif tool == "browser_verify_text_visible":
-            text = params.get("text", "")
-            if text:
-                # Escape quotes in text
-                escaped_text = text.replace('"', '\\"').replace("'", "\\'")
-                return [
-                    f"{indent}# Verify text is visible: '{text}'",
-                    f"{indent}WebDriverWait(driver, 10).until(",
-                    f'{indent}    EC.visibility_of_element_located((By.XPATH, "//*[contains(text(), \'{escaped_text}\')]"))',
-                    f"{indent})"
-                ]
-
-        # Select option
-        elif tool == "select_option":
-            ref = params.get("ref")
-            values = params.get("values", [])
-            element_desc = params.get("element", "dropdown")
-
-            if values:
-                value = values[0] if isinstance(values, list) else values
-                return [
-                    f"{indent}# Select option: {value} from {element_desc}",
-                    f"{indent}select_element = WebDriverWait(driver, 10).until(",
-                    f'{indent}    EC.presence_of_element_located((By.TAG_NAME, "select"))',
-                    f"{indent})",
-                    f"{indent}select = Select(select_element)",
-                    f'{indent}select.select_by_visible_text("{value}")'
-                ]
-
-        # Wait for condition
-        elif tool == "wait_for":
-            condition = params.get("condition")
-            timeout = params.get("timeout", 10)
-
-            if condition == "page_load":
-                return [
-                    f"{indent}# Wait for page to load",
-                    f"{indent}WebDriverWait(driver, {timeout}).until(",
-                    f'{indent}    lambda d: d.execute_script("return document.readyState") == "complete"',
-                    f"{indent})"
-                ]
-
-        # Take screenshot
-        elif tool == "take_screenshot":
-            filename = params.get("filename", "screenshot.png")
-            return [
-                f"{indent}# Take screenshot",
-                f'{indent}driver.save_screenshot("{filename}")'
-            ]
-
-        # Hover
-        elif tool == "hover_element":
-            element_desc = params.get("element", "element")
-            return [
-                f"{indent}# Hover over: {element_desc}",
-                f"{indent}from selenium.webdriver.common.action_chains import ActionChains",
-                f"{indent}element = WebDriverWait(driver, 10).until(",
-                f'{indent}    EC.presence_of_element_located((By.XPATH, "//*[contains(text(), \'{element_desc.split()[0]}\')]"))',
-                f"{indent})",
-                f"{indent}ActionChains(driver).move_to_element(element).perform()"
-            ]
+        logger.debug("Generating code for tool: %s, params: %s", tool, params)
+
+        handler = self.TOOL_HANDLERS.get(tool)
+        if handler is not None:
+            block = handler(self, params, indent, snapshot, {} if locators is None else locators)
+            if block is not None:
+                return block
 
         # Unknown tool - generate helpful TODO
-        logger.warning(f"Unhandled tool in script generation: {tool}")
+        logger.warning("Unhandled tool in script generation: %s", tool)
         return f'{indent}# TODO: Implement {tool} with params: {params}'
 
-    def _action_to_robot_framework(self, action: Dict[str, Any], context: Context = None) -> str:
-        """Convert an action to Robot Framework keyword."""
-        tool = action.get("tool")
-        params = action.get("params", {})
+    def _robot_navigate(self, params: Dict[str, Any]) -> str:
+        url = params.get("url")
+        return f'Go To    {url}'
 
-        if tool == "navigate_to":
-            url = params.get("url")
-            return f'Go To    {url}'
+    def _robot_click(self, params: Dict[str, Any]) -> str:
+        element_desc = params.get("element", "element")
+        search_text = element_desc.partition(" ")[0] or "element"
+        return f'Click Element    xpath=//*[contains(text(), "{search_text}")]'
 
-        elif tool == "click_element":
-            element_desc = params.get("element", "element")
-            search_text = element_desc.split()[0] if element_desc else "element"
-            return f'Click Element    xpath=//*[contains(text(), "{search_text}")]'
+    def _robot_input(self, params: Dict[str, Any]) -> str:
+        text = params.get("text", "")
+        return f'Input Text    xpath=//input    {text}'
 
-        elif tool == "input_text":
-            text = params.get("text", "")
-            return f'Input Text    xpath=//input    {text}'
+    def _robot_verify_text(self, params: Dict[str, Any]) -> str:
+        text = params.get("text", "")
+        return f'Page Should Contain    {text}'
 
-        elif tool == "browser_verify_text_visible":
-            text = params.get("text", "")
-            return f'Page Should Contain    {text}'
+    def _robot_screenshot(self, params: Dict[str, Any]) -> str:
+        filename = params.get("filename", "screenshot.png")
+        return f'Capture Page Screenshot    {filename}'
 
-        elif tool == "take_screenshot":
-            filename = params.get("filename", "screenshot.png")
-            return f'Capture Page Screenshot    {filename}'
+    ROBOT_HANDLERS = {
+        "navigate_to": _robot_navigate,
+        "click_element": _robot_click,
+        "input_text": _robot_input,
+        "browser_verify_text_visible": _robot_verify_text,
+        "take_screenshot": _robot_screenshot,
+    }
+
+    def _action_to_robot_framework(self, action: Dict[str, Any], context: Context = None) -> str:
+        """Convert an action to Robot Framework keyword."""
+        tool = action.get("tool")
+        params = action.get("params", {})
+
+        handler = self.ROBOT_HANDLERS.get(tool)
+        if handler is not None:
+            return handler(self, params)
 
         return f'# TODO: {tool} - {params}'
 
-    def _get_locator_for_ref(self, ref: str, context: Context) -> Optional[tuple]:
-        """Get best locator strategy for an element reference from context snapshot."""
-        if not context or not context.current_snapshot or not ref:
-            return None
+    def _get_locator_for_ref(self, ref: str, snapshot: Optional[PageSnapshot],
+                             locators: Optional[Dict[str, tuple]] = None) -> Optional[tuple]:
+        """Get best locator strategy for an element reference from the page snapshot.
 
-        try:
-            return context.current_snapshot.ref_locator(ref)
-        except Exception as e:
-            logger.debug(f"Could not get locator for ref {ref}: {e}")
+        ``PageSnapshot.ref_locator`` always returns a locator (falling back to a
+        data-ref selector), so no exception handling is needed here. When a
+        ``locators`` dict is given, results are memoized in it by ref.
+        """
+        if snapshot is None or not ref:
             return None
+
+        if locators is None:
+            return snapshot.ref_locator(ref)
+
+        locator = locators.get(ref)
+        if locator is None:
+            locator = locators[ref] = snapshot.ref_locator(ref)
+        return locator
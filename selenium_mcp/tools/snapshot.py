@@ -1,18 +1,68 @@
 """Snapshot and element interaction tools - matches playwright-mcp snapshot.ts exactly."""
 
+import io
 import logging
-from typing import List
+from itertools import islice
+from operator import attrgetter
+from typing import List, Optional
 from pydantic import BaseModel, Field
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    UnexpectedTagNameException,
+)
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support.select import Select
 
 from ..tool_base import BaseTool, ToolSchema, ToolResult
-from ..context import Context
+from ..context import Context, PageSnapshot
 
 logger = logging.getLogger(__name__)
 
+SNAPSHOT_CODE = (
+    "# Capture page snapshot for element interaction",
+    "# This captures all interactive elements with references"
+)
+
+# Property tokens of a YAML element line; heading tags get a level
+HEADING_LEVEL = {"h1": " [level=1]", "h2": " [level=2]", "h3": " [level=3]"}
+DISABLED_PROP = " [disabled]"
+
+# Fetches the ElementInfo fields the YAML line needs in one call
+ELEMENT_YAML_FIELDS = attrgetter("ref", "tag_name", "text", "attributes", "is_clickable")
+
+def render_snapshot_yaml(snapshot: PageSnapshot, max_elements: Optional[int] = None) -> str:
+    """Render a snapshot as the playwright-mcp style YAML accessibility tree.
+    
+    Only the first `max_elements` elements are serialized when given; the rest
+    stay in the snapshot for ref lookups and are summarized in a trailing comment.
+    """
+    buf = io.StringIO()
+    write = buf.write
+    heading_level = HEADING_LEVEL.get
+    write(f"### Page state\n- Page URL: {snapshot.url}\n- Page Title: {snapshot.title}\n- Page Snapshot:\n```yaml\n")
+    
+    # One line per element: - tag "text" [ref=..] [role=..] [disabled] [level=..]
+    elements = map(ELEMENT_YAML_FIELDS, snapshot.elements.values())
+    for ref, tag, text, attributes, is_clickable in islice(elements, max_elements):
+        text_part = f' "{text}"' if text else ""
+        role_part = f" [role={role}]" if (role := attributes.get("role")) else ""
+        disabled_part = "" if is_clickable else DISABLED_PROP
+        write(f"- {tag}{text_part} [ref={ref}]{role_part}{disabled_part}{heading_level(tag, '')}\n")
+    
+    omitted = len(snapshot.elements) - max_elements if max_elements is not None else 0
+    if omitted > 0:
+        write(f"# ... {omitted} more elements omitted\n")
+    write("```")
+    return buf.getvalue()
+
 class SnapshotParams(BaseModel):
     """Parameters for capturing snapshot."""
-    # No parameters needed for snapshot
+    max_elements: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Only list the first N elements in the snapshot (all elements are still addressable by ref)"
+    )
 
 class ClickParams(BaseModel):
     """Parameters for clicking - matches playwright-mcp elementSchema exactly."""
@@ -44,60 +94,20 @@ class SnapshotTool(BaseTool):
                 element_count = len(context.current_snapshot.elements)
                 logger.info(f"📸 Captured snapshot with {element_count} elements")
                 
-                # Generate YAML accessibility tree like playwright-mcp
-                yaml_lines = []
-                yaml_lines.append("### Page state")
-                yaml_lines.append(f"- Page URL: {context.current_snapshot.url}")
-                yaml_lines.append(f"- Page Title: {context.current_snapshot.title}")
-                yaml_lines.append("- Page Snapshot:")
-                yaml_lines.append("```yaml")
-                
-                # Build accessibility tree in YAML format
-                for ref, element in context.current_snapshot.elements.items():
-                    # Format element like playwright-mcp
-                    element_line = f"- {element.tag_name}"
-                    
-                    # Add text in quotes if present
-                    if element.text:
-                        element_line += f' "{element.text}"'
-                    
-                    # Add properties in brackets
-                    props = []
-                    props.append(f"[ref={ref}]")
-                    
-                    if element.attributes.get("role"):
-                        props.append(f'[role={element.attributes["role"]}]')
-                    
-                    if not element.is_clickable:
-                        props.append("[disabled]")
-                    
-                    # Special handling for specific elements
-                    if element.tag_name == "h1":
-                        props.append("[level=1]")
-                    elif element.tag_name == "h2":
-                        props.append("[level=2]")
-                    elif element.tag_name == "h3":
-                        props.append("[level=3]")
-                    
-                    element_line += " " + " ".join(props)
-                    yaml_lines.append(element_line)
-                
-                yaml_lines.append("```")
-                
-                # Return the YAML format that Cursor expects
-                return {"snapshot": "\n".join(yaml_lines)}
+                # Return the YAML format that Cursor expects; an unchanged page
+                # keeps its snapshot object, so the rendering is reused
+                snapshot = context.current_snapshot
+                if params.max_elements is not None and params.max_elements < element_count:
+                    return {"snapshot": render_snapshot_yaml(snapshot, params.max_elements)}
+                if snapshot.yaml_cache is None:
+                    snapshot.yaml_cache = render_snapshot_yaml(snapshot)
+                return {"snapshot": snapshot.yaml_cache}
             else:
                 logger.error("❌ Failed to capture snapshot")
                 return {"error": "Snapshot capture failed"}
         
-        # Robot Framework code (internal operation)
-        code = [
-            "# Capture page snapshot for element interaction",
-            "# This captures all interactive elements with references"
-        ]
-        
         return ToolResult(
-            code=code,
+            code=SNAPSHOT_CODE,  # Robot Framework code (internal operation)
             action=snapshot_action,
             capture_snapshot=False,  # We handle it manually
             wait_for_network=False
@@ -106,6 +116,9 @@ class SnapshotTool(BaseTool):
 class ClickTool(BaseTool):
     """Click on element - matches playwright-mcp browser_click exactly."""
     
+    # Robot Framework code, filled per call
+    CODE_TEMPLATE = ("# Click {element}", "Click Element    {locator}")
+    
     def _create_schema(self) -> ToolSchema:
         return ToolSchema(
             name="click_element",
@@ -127,13 +140,13 @@ class ClickTool(BaseTool):
         by, locator_value = snapshot.ref_locator(params.ref)
         
         # Click action with fallback - more robust than playwright-mcp
-        async def click_action():
-            element = driver.find_element(by, locator_value)
-            
+        def click(element):
             try:
                 # Try standard Selenium click first (like playwright-mcp does)
                 element.click()
                 logger.info(f"🖱️ Clicked: {params.element}")
+            except StaleElementReferenceException:
+                raise  # with_element re-finds the element and retries
             except Exception as selenium_error:
                 # Fallback to JavaScript click (better than playwright-mcp)
                 logger.warning(f"⚠️ Standard click failed: {str(selenium_error)}")
@@ -147,11 +160,13 @@ class ClickTool(BaseTool):
                     logger.error(f"❌ Both clicks failed - Standard: {selenium_error}, JavaScript: {js_error}")
                     raise selenium_error  # Raise original error
         
+        async def click_action():
+            # Use the element captured with the snapshot; re-found only if stale
+            snapshot.with_element(driver, params.ref, click)
+        
         # Robot Framework code (matches playwright-mcp code generation pattern)
-        code = [
-            f"# Click {params.element}",
-            f"Click Element    {locator_value}"
-        ]
+        fields = {"element": params.element, "locator": locator_value}
+        code = [line.format_map(fields) for line in self.CODE_TEMPLATE]
         
         return ToolResult(
             code=code,
@@ -168,6 +183,9 @@ class HoverParams(BaseModel):
 class HoverTool(BaseTool):
     """Hover over element."""
     
+    # Robot Framework code, filled per call
+    CODE_TEMPLATE = ("# Hover over {element}", "Mouse Over    {locator}")
+    
     def _create_schema(self) -> ToolSchema:
         return ToolSchema(
             name="hover_element",
@@ -187,16 +205,14 @@ class HoverTool(BaseTool):
         
         # Hover action
         async def hover_action():
-            from selenium.webdriver.common.action_chains import ActionChains
-            element = driver.find_element(by, locator_value)
-            ActionChains(driver).move_to_element(element).perform()
+            snapshot.with_element(
+                driver, params.ref, lambda element: context.action_chains(driver).move_to_element(element).perform()
+            )
             logger.info(f"🖱️ Hovered over: {params.element}")
         
         # Robot Framework code
-        code = [
-            f"# Hover over {params.element}",
-            f"Mouse Over    {locator_value}"
-        ]
+        fields = {"element": params.element, "locator": locator_value}
+        code = [line.format_map(fields) for line in self.CODE_TEMPLATE]
         
         return ToolResult(
             code=code,
@@ -214,6 +230,9 @@ class SelectParams(BaseModel):
 class SelectTool(BaseTool):
     """Select option from dropdown."""
     
+    # Robot Framework code, filled per call
+    CODE_TEMPLATE = ("# Select options [{values}] in {element}", "Select From List By Label    {locator}    {values}")
+    
     def _create_schema(self) -> ToolSchema:
         return ToolSchema(
             name="select_option",
@@ -232,35 +251,34 @@ class SelectTool(BaseTool):
         by, locator_value = snapshot.ref_locator(params.ref)
         
         # Select action
-        async def select_action():
-            from selenium.webdriver.support.ui import Select
-            element = driver.find_element(by, locator_value)
-            
-            if element.tag_name.lower() == 'select':
+        def select_in(element):
+            # Select() checks the tag once; options are then picked natively by label, then by value
+            try:
                 select = Select(element)
-                for value in params.values:
-                    try:
-                        select.select_by_visible_text(value)
-                        logger.info(f"📋 Selected '{value}' from {params.element}")
-                        break
-                    except:
-                        try:
-                            select.select_by_value(value)
-                            logger.info(f"📋 Selected '{value}' (by value) from {params.element}")
-                            break
-                        except:
-                            continue
-            else:
+            except UnexpectedTagNameException:
                 # Not a select element, try clicking
                 element.click()
                 logger.info(f"📋 Clicked dropdown {params.element}")
+                return
+            
+            for value in params.values:
+                for pick in (select.select_by_visible_text, select.select_by_value):
+                    try:
+                        pick(value)
+                    except NoSuchElementException:
+                        continue
+                    logger.info(f"📋 Selected '{value}' from {params.element}")
+                    return
+            
+            logger.warning(f"⚠️ No option matching {params.values} in {params.element}")
+        
+        async def select_action():
+            snapshot.with_element(driver, params.ref, select_in)
         
         # Robot Framework code
         values_str = " | ".join(params.values) if len(params.values) > 1 else params.values[0]
-        code = [
-            f"# Select options [{values_str}] in {params.element}",
-            f"Select From List By Label    {locator_value}    {values_str}"
-        ]
+        fields = {"element": params.element, "locator": locator_value, "values": values_str}
+        code = [line.format_map(fields) for line in self.CODE_TEMPLATE]
         
         return ToolResult(
             code=code,
@@ -1,6 +1,7 @@
 """Tab management tools."""
 
 import logging
+from typing import Dict, Optional, Tuple
 from pydantic import BaseModel, Field
 
 from ..tool_base import BaseTool, ToolSchema, ToolResult
@@ -8,6 +9,66 @@ from ..context import Context
 
 logger = logging.getLogger(__name__)
 
+TAB_LIST_CODE = (
+    "# List all browser tabs",
+    "# Note: Tab listing not directly supported in Robot Framework"
+)
+
+TAB_NEW_CODE = (
+    "# Open new browser tab",
+    "Execute Javascript    window.open('')",
+    "Switch Window    NEW"
+)
+
+def page_targets(driver) -> Optional[Dict[str, Tuple[str, str]]]:
+    """Map window handle -> (title, url) for every page with one CDP call.
+    
+    Chromium window handles are CDP target ids. CDP reports the URL as the
+    title of an untitled page, so that is mapped back to the "" driver.title
+    returns. Returns None when CDP is unavailable so callers can fall back to
+    switching through the tabs.
+    """
+    if not hasattr(driver, "execute_cdp_cmd"):
+        return None
+    try:
+        targets = driver.execute_cdp_cmd("Target.getTargets", {})["targetInfos"]
+    except Exception as e:
+        logger.debug(f"Target.getTargets unavailable: {e}")
+        return None
+    return {
+        target["targetId"]: ("" if target["title"] == target["url"] else target["title"], target["url"])
+        for target in targets
+        if target["type"] == "page"
+    }
+
+def create_page_target(driver, url: str) -> Optional[str]:
+    """Open url in a new tab with one CDP call and return its window handle.
+    
+    Returns None when CDP is unavailable so callers can fall back to window.open().
+    """
+    if not hasattr(driver, "execute_cdp_cmd"):
+        return None
+    try:
+        return driver.execute_cdp_cmd("Target.createTarget", {"url": url})["targetId"]
+    except Exception as e:
+        logger.debug(f"Target.createTarget unavailable: {e}")
+        return None
+
+def close_page_target(driver, handle: str) -> bool:
+    """Close another tab with this window handle via CDP without switching to it.
+    
+    Not for the current tab, whose DevTools session the command would run
+    through. Returns False when CDP is unavailable or the close failed, so
+    callers can fall back to switch_to.window() + close().
+    """
+    if not hasattr(driver, "execute_cdp_cmd"):
+        return False
+    try:
+        return driver.execute_cdp_cmd("Target.closeTarget", {"targetId": handle}).get("success", True)
+    except Exception as e:
+        logger.debug(f"Target.closeTarget unavailable: {e}")
+        return False
+
 class TabListParams(BaseModel):
     """Parameters for listing tabs."""
     # No parameters needed
@@ -44,23 +105,27 @@ class TabListTool(BaseTool):
             current_handle = driver.current_window_handle
             
             tabs_info = []
-            for i, handle in enumerate(handles):
-                driver.switch_to.window(handle)
-                title = driver.title
-                url = driver.current_url
-                is_current = handle == current_handle
-                tabs_info.append(f"Tab {i}: {title} - {url} {'(current)' if is_current else ''}")
-            
-            # Switch back to original tab
-            driver.switch_to.window(current_handle)
+            targets = page_targets(driver)
+            if targets is not None and all(handle in targets for handle in handles):
+                for i, handle in enumerate(handles):
+                    title, url = targets[handle]
+                    is_current = handle == current_handle
+                    tabs_info.append(f"Tab {i}: {title} - {url} {'(current)' if is_current else ''}")
+            else:
+                for i, handle in enumerate(handles):
+                    driver.switch_to.window(handle)
+                    title = driver.title
+                    url = driver.current_url
+                    is_current = handle == current_handle
+                    tabs_info.append(f"Tab {i}: {title} - {url} {'(current)' if is_current else ''}")
+                
+                # Switch back to original tab
+                driver.switch_to.window(current_handle)
             
             logger.info(f"📑 Listed {len(handles)} tabs")
             return "\n".join(tabs_info)
         
-        code = [
-            "# List all browser tabs",
-            "# Note: Tab listing not directly supported in Robot Framework"
-        ]
+        code = TAB_LIST_CODE
         
         return ToolResult(
             code=code,
@@ -121,26 +186,30 @@ class TabNewTool(BaseTool):
         
         async def new_tab_action():
             driver = context.current_tab_or_die()
-            driver.execute_script("window.open('');")
-            driver.switch_to.window(driver.window_handles[-1])
+            handle = create_page_target(driver, params.url or "about:blank")
+            
+            if handle is not None:
+                # The target starts loading the URL as it is created; ChromeDriver
+                # waits for that navigation before running the next command
+                driver.switch_to.window(handle)
+            else:
+                driver.execute_script("window.open('');")
+                driver.switch_to.window(driver.window_handles[-1])
+                if params.url:
+                    driver.get(params.url)
             
             if params.url:
-                driver.get(params.url)
                 logger.info(f"📑 Opened new tab and navigated to {params.url}")
             else:
                 logger.info("📑 Opened new blank tab")
         
-        code = [
-            "# Open new browser tab",
-            "Execute Javascript    window.open('')",
-            "Switch Window    NEW"
-        ]
+        code = TAB_NEW_CODE
         
         if params.url:
-            code.extend([
+            code += (
                 f"# Navigate to {params.url}",
                 f"Go To    {params.url}"
-            ])
+            )
         
         return ToolResult(
             code=code,
@@ -171,8 +240,15 @@ class TabCloseTool(BaseTool):
                 current_handle = driver.current_window_handle
                 target_handle = handles[params.tab_id]
                 
-                driver.switch_to.window(target_handle)
-                driver.close()
+                if target_handle == current_handle:
+                    # CDP would go through the page being closed; close it natively
+                    driver.close()
+                elif not close_page_target(driver, target_handle):
+                    # The close may have gone through before the error; only fall back for a live tab
+                    if target_handle in driver.window_handles:
+                        driver.switch_to.window(target_handle)
+                        driver.close()
+                        driver.switch_to.window(current_handle)
                 
                 # Switch to another tab if we closed the current one
                 remaining_handles = [h for h in handles if h != target_handle]
@@ -4,7 +4,6 @@ import logging
 from typing import List
 from pydantic import BaseModel, Field
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 from ..tool_base import BaseTool, ToolSchema, ToolResult
@@ -12,6 +11,67 @@ from ..context import Context
 
 logger = logging.getLogger(__name__)
 
+# Helpers shared by the text scripts below. Texts arrive as script arguments and are
+# quoted into XPath literals in the browser, so quotes in them cannot break the
+# expression. `visible` approximates WebElement.is_displayed() without a roundtrip:
+# a non-empty box, and no display:none, visibility:hidden or opacity:0 on the
+# element or its ancestors (computed style of the element itself where
+# checkVisibility() is not supported).
+TEXT_MATCH_JS = """
+const literal = t => !t.includes("'") ? "'" + t + "'"
+    : !t.includes('"') ? '"' + t + '"'
+    : "concat('" + t.split("'").join("', \\"'\\", '") + "')";
+const matches = text => document.evaluate("//*[contains(text(), " + literal(text) + ")]", document, null,
+    XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+const visible = e => {
+    const r = e.getBoundingClientRect();
+    if (!(r.width > 0 && r.height > 0)) return false;
+    if (e.checkVisibility) return e.checkVisibility({opacityProperty: true, visibilityProperty: true});
+    const style = getComputedStyle(e);
+    return style.visibility !== "hidden" && style.opacity !== "0";
+};
+"""
+
+# For each text in arguments[0]: elements whose own text contains it, and how many are visible
+TEXT_VISIBILITY_JS = TEXT_MATCH_JS + """
+return arguments[0].map(text => {
+    const found = matches(text);
+    let count = 0;
+    for (let i = 0; i < found.snapshotLength; i++) {
+        if (visible(found.snapshotItem(i))) count++;
+    }
+    return {total: found.snapshotLength, visible: count};
+});
+"""
+
+# For each text in arguments[0]: whether any element showing it is visible (stops at the first)
+TEXTS_VISIBLE_JS = TEXT_MATCH_JS + """
+return arguments[0].map(text => {
+    const found = matches(text);
+    for (let i = 0; i < found.snapshotLength; i++) {
+        if (visible(found.snapshotItem(i))) return true;
+    }
+    return false;
+});
+"""
+
+def text_visibility(driver, texts: List[str]) -> List[dict]:
+    """Get {"total", "visible"} match counts for each text in a single roundtrip."""
+    return driver.execute_script(TEXT_VISIBILITY_JS, list(texts))
+
+def xpath_literal(text: str) -> str:
+    """Quote text as an XPath 1.0 string literal (Python twin of `literal` in TEXT_MATCH_JS)."""
+    if "'" not in text:
+        return f"'{text}'"
+    if '"' not in text:
+        return f'"{text}"'
+    return "concat('" + "', \"'\", '".join(text.split("'")) + "')"
+
+def text_visible(driver, text: str) -> bool:
+    """Whether any element whose own text contains `text` is displayed (one find plus one check per match)."""
+    elements = driver.find_elements(By.XPATH, f"//*[contains(text(), {xpath_literal(text)})]")
+    return any(e.is_displayed() for e in elements)
+
 class VerifyElementVisibleParams(BaseModel):
     """Parameters for verifying element visibility."""
     element: str = Field(description="Human-readable element description")
@@ -37,25 +97,18 @@ class BrowserVerifyElementVisibleTool(BaseTool):
 
         async def verify_action():
             try:
-                element = WebDriverWait(driver, 10).until(
+                # The condition only returns once the element is displayed, so
+                # no separate is_displayed() roundtrip is needed afterwards
+                context.driver_wait(driver).until(
                     EC.visibility_of_element_located((by, locator))
                 )
-                is_visible = element.is_displayed()
 
-                if is_visible:
-                    logger.info(f"✅ Element visible: {params.element}")
-                    return {
-                        "verified": True,
-                        "message": f"Element '{params.element}' is visible",
-                        "element": params.element
-                    }
-                else:
-                    logger.warning(f"❌ Element not visible: {params.element}")
-                    return {
-                        "verified": False,
-                        "message": f"Element '{params.element}' exists but is not visible",
-                        "element": params.element
-                    }
+                logger.info(f"✅ Element visible: {params.element}")
+                return {
+                    "verified": True,
+                    "message": f"Element '{params.element}' is visible",
+                    "element": params.element
+                }
             except Exception as e:
                 logger.error(f"❌ Verification failed: {e}")
                 return {
@@ -99,22 +152,20 @@ class BrowserVerifyTextVisibleTool(BaseTool):
 
         async def verify_action():
             try:
-                # Wait for text to be present
-                WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.XPATH, f"//*[contains(text(), '{params.text}')]"))
-                )
+                # Wait for text to be present; the same call reports how much is visible
+                def text_present(d):
+                    counts = text_visibility(d, [params.text])[0]
+                    return counts if counts["total"] else False
 
-                # Check if visible
-                elements = driver.find_elements(By.XPATH, f"//*[contains(text(), '{params.text}')]")
-                visible_elements = [e for e in elements if e.is_displayed()]
+                counts = context.driver_wait(driver).until(text_present)
 
-                if visible_elements:
+                if counts["visible"]:
                     logger.info(f"✅ Text visible: '{params.text}'")
                     return {
                         "verified": True,
                         "message": f"Text '{params.text}' is visible",
                         "text": params.text,
-                        "count": len(visible_elements)
+                        "count": counts["visible"]
                     }
                 else:
                     logger.warning(f"❌ Text not visible: '{params.text}'")
@@ -173,8 +224,9 @@ class BrowserVerifyValueTool(BaseTool):
 
         async def verify_action():
             try:
-                element = driver.find_element(by, locator)
-                actual_value = element.get_attribute('value') or element.text
+                actual_value = snapshot.with_element(
+                    driver, params.ref, lambda element: element.get_attribute('value') or element.text
+                )
 
                 if actual_value == params.expected_value:
                     logger.info(f"✅ Value verified: {params.element} = '{params.expected_value}'")
@@ -239,22 +291,32 @@ class BrowserVerifyListVisibleTool(BaseTool):
             results = []
             all_verified = True
 
-            for item in params.items:
-                try:
-                    elements = driver.find_elements(By.XPATH, f"//*[contains(text(), '{item}')]")
-                    visible_elements = [e for e in elements if e.is_displayed()]
-
-                    if visible_elements:
-                        results.append({"item": item, "verified": True})
-                        logger.info(f"✅ Item visible: '{item}'")
-                    else:
-                        results.append({"item": item, "verified": False})
-                        all_verified = False
-                        logger.warning(f"❌ Item not visible: '{item}'")
-                except Exception as e:
-                    results.append({"item": item, "verified": False, "error": str(e)})
+            try:
+                # All items are checked in one browser roundtrip
+                visible = driver.execute_script(TEXTS_VISIBLE_JS, params.items)
+            except Exception as e:
+                # Check items one by one instead; a WebDriver session takes one command at a time
+                logger.warning(f"⚠️ Batched list check failed, checking items individually: {e}")
+                visible = []
+                for item in params.items:
+                    try:
+                        visible.append(text_visible(driver, item))
+                    except Exception as item_error:
+                        visible.append(item_error)
+
+            for index, item in enumerate(params.items):
+                if isinstance(visible[index], Exception):
+                    error = visible[index]
+                    results.append({"item": item, "verified": False, "error": str(error)})
+                    all_verified = False
+                    logger.error(f"❌ Error verifying '{item}': {error}")
+                elif visible[index]:
+                    results.append({"item": item, "verified": True})
+                    logger.info(f"✅ Item visible: '{item}'")
+                else:
+                    results.append({"item": item, "verified": False})
                     all_verified = False
-                    logger.error(f"❌ Error verifying '{item}': {e}")
+                    logger.warning(f"❌ Item not visible: '{item}'")
 
             verified_count = sum(1 for r in results if r["verified"])
 
@@ -1,13 +1,47 @@
 """Wait and timing tools."""
 
+import asyncio
 import logging
+from functools import partial
 from pydantic import BaseModel, Field
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
 
 from ..tool_base import BaseTool, ToolSchema, ToolResult
 from ..context import Context
 
 logger = logging.getLogger(__name__)
 
+# Conditions that wait on an element from the page snapshot
+ELEMENT_CONDITIONS = frozenset({"element_visible", "element_hidden"})
+
+VISIBLE_NO_REF_CODE = (
+    "# Wait for element to be visible",
+    "# Note: Element reference required"
+)
+HIDDEN_NO_REF_CODE = (
+    "# Wait for element to be hidden",
+    "# Note: Element reference required"
+)
+
+# First delay between document.readyState checks; doubles up to the poll interval
+READY_POLL_START = 0.025
+
+
+async def wait_ready(driver, timeout: float, max_interval: float) -> None:
+    """Poll document.readyState with exponential backoff until the page is complete."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    delay = min(READY_POLL_START, max_interval)
+    while await asyncio.to_thread(driver.execute_script, "return document.readyState") != "complete":
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            raise TimeoutException(f"Page did not finish loading within {timeout} seconds")
+        await asyncio.sleep(min(delay, remaining))
+        delay = min(delay * 2, max_interval)
+
+
 class WaitParams(BaseModel):
     """Parameters for wait operations."""
     condition: str = Field(description="Wait condition: 'time', 'element_visible', 'element_hidden', 'page_load'")
@@ -15,6 +49,83 @@ class WaitParams(BaseModel):
     element: str = Field(default="", description="Element description (for element conditions)")
     ref: str = Field(default="", description="Element reference (for element conditions)")
     duration: float = Field(default=1.0, description="Duration in seconds (for time condition)")
+    poll_interval: float = Field(default=0.1, gt=0, description="Seconds between condition checks (for element and page_load conditions)")
+
+
+async def run_time_wait(driver, params: WaitParams, locator) -> str:
+    # Yield to the event loop so other tool calls keep running
+    await asyncio.sleep(params.duration)
+    logger.info("⏱️ Waited for %s seconds", params.duration)
+    return f"Waited {params.duration} seconds"
+
+
+def time_wait_code(params: WaitParams, locator) -> tuple:
+    return (
+        f"# Wait for {params.duration} seconds",
+        f"Sleep    {params.duration}s"
+    )
+
+
+async def run_visible_wait(driver, params: WaitParams, locator) -> str:
+    if locator is None:
+        raise ValueError("Element reference required for element_visible condition")
+    
+    wait = WebDriverWait(driver, params.timeout, poll_frequency=params.poll_interval)
+    # Polling blocks for up to the timeout; keep it off the event loop
+    await asyncio.to_thread(wait.until, EC.visibility_of_element_located(locator))
+    logger.info("⏱️ Element %s became visible", params.element)
+    return f"Element {params.element} is visible"
+
+
+def visible_wait_code(params: WaitParams, locator) -> tuple:
+    if locator is None:
+        return VISIBLE_NO_REF_CODE
+    return (
+        f"# Wait for {params.element} to be visible",
+        f"Wait Until Element Is Visible    {locator[1]}    timeout={params.timeout}s"
+    )
+
+
+async def run_hidden_wait(driver, params: WaitParams, locator) -> str:
+    if locator is None:
+        raise ValueError("Element reference required for element_hidden condition")
+    
+    wait = WebDriverWait(driver, params.timeout, poll_frequency=params.poll_interval)
+    await asyncio.to_thread(wait.until, EC.invisibility_of_element_located(locator))
+    logger.info("⏱️ Element %s became hidden", params.element)
+    return f"Element {params.element} is hidden"
+
+
+def hidden_wait_code(params: WaitParams, locator) -> tuple:
+    if locator is None:
+        return HIDDEN_NO_REF_CODE
+    return (
+        f"# Wait for {params.element} to be hidden",
+        f"Wait Until Element Is Not Visible    {locator[1]}    timeout={params.timeout}s"
+    )
+
+
+async def run_page_load_wait(driver, params: WaitParams, locator) -> str:
+    # A page that is already loaded returns after a single round-trip
+    await wait_ready(driver, params.timeout, params.poll_interval)
+    logger.info("⏱️ Page load completed")
+    return "Page load completed"
+
+
+def page_load_wait_code(params: WaitParams, locator) -> tuple:
+    return (
+        "# Wait for page to load completely",
+        f"Wait Until Keyword Succeeds    {params.timeout}s    {params.poll_interval}s    Execute Javascript    return document.readyState === 'complete'"
+    )
+
+
+# Condition name -> (action runner, Robot Framework code builder)
+CONDITION_HANDLERS = {
+    "time": (run_time_wait, time_wait_code),
+    "element_visible": (run_visible_wait, visible_wait_code),
+    "element_hidden": (run_hidden_wait, hidden_wait_code),
+    "page_load": (run_page_load_wait, page_load_wait_code),
+}
 
 class WaitTool(BaseTool):
     """Wait for various conditions."""
@@ -29,98 +140,21 @@ class WaitTool(BaseTool):
     
     async def handle(self, context: Context, params: WaitParams) -> ToolResult:
         """Wait for specified condition."""
-        driver = context.current_tab_or_die()
+        try:
+            runner, code_builder = CONDITION_HANDLERS[params.condition]
+        except KeyError:
+            raise ValueError(f"Invalid wait condition: {params.condition}") from None
         
-        async def wait_action():
-            import time
-            from selenium.webdriver.support.ui import WebDriverWait
-            from selenium.webdriver.support import expected_conditions as EC
-            from selenium.webdriver.common.by import By
-            
-            if params.condition == "time":
-                time.sleep(params.duration)
-                logger.info(f"⏱️ Waited for {params.duration} seconds")
-                return f"Waited {params.duration} seconds"
-                
-            elif params.condition == "element_visible":
-                if not params.ref:
-                    raise ValueError("Element reference required for element_visible condition")
-                    
-                snapshot = context.snapshot_or_die()
-                by, locator_value = snapshot.ref_locator(params.ref)
-                
-                wait = WebDriverWait(driver, params.timeout)
-                wait.until(EC.visibility_of_element_located((by, locator_value)))
-                logger.info(f"⏱️ Element {params.element} became visible")
-                return f"Element {params.element} is visible"
-                
-            elif params.condition == "element_hidden":
-                if not params.ref:
-                    raise ValueError("Element reference required for element_hidden condition")
-                    
-                snapshot = context.snapshot_or_die()
-                by, locator_value = snapshot.ref_locator(params.ref)
-                
-                wait = WebDriverWait(driver, params.timeout)
-                wait.until(EC.invisibility_of_element_located((by, locator_value)))
-                logger.info(f"⏱️ Element {params.element} became hidden")
-                return f"Element {params.element} is hidden"
-                
-            elif params.condition == "page_load":
-                wait = WebDriverWait(driver, params.timeout)
-                wait.until(lambda d: d.execute_script("return document.readyState") == "complete")
-                logger.info(f"⏱️ Page load completed")
-                return "Page load completed"
-                
-            else:
-                raise ValueError(f"Invalid wait condition: {params.condition}")
+        driver = context.current_tab_or_die()
         
-        # Robot Framework code
-        if params.condition == "time":
-            code = [
-                f"# Wait for {params.duration} seconds",
-                f"Sleep    {params.duration}s"
-            ]
-        elif params.condition == "element_visible":
-            snapshot = context.snapshot_or_die() if params.ref else None
-            if snapshot:
-                by, locator_value = snapshot.ref_locator(params.ref)
-                code = [
-                    f"# Wait for {params.element} to be visible",
-                    f"Wait Until Element Is Visible    {locator_value}    timeout={params.timeout}s"
-                ]
-            else:
-                code = [
-                    f"# Wait for element to be visible",
-                    "# Note: Element reference required"
-                ]
-        elif params.condition == "element_hidden":
-            snapshot = context.snapshot_or_die() if params.ref else None
-            if snapshot:
-                by, locator_value = snapshot.ref_locator(params.ref)
-                code = [
-                    f"# Wait for {params.element} to be hidden",
-                    f"Wait Until Element Is Not Visible    {locator_value}    timeout={params.timeout}s"
-                ]
-            else:
-                code = [
-                    f"# Wait for element to be hidden",
-                    "# Note: Element reference required"
-                ]
-        elif params.condition == "page_load":
-            code = [
-                "# Wait for page to load completely",
-                f"Wait Until Keyword Succeeds    {params.timeout}s    1s    Execute Javascript    return document.readyState === 'complete'"
-            ]
-        else:
-            code = [
-                f"# Wait for condition: {params.condition}",
-                f"Sleep    {params.timeout}s"
-            ]
+        # Resolve the ref once for both the action and the generated code
+        locator = None
+        if params.condition in ELEMENT_CONDITIONS and params.ref:
+            locator = context.snapshot_or_die().ref_locator(params.ref)
         
         return ToolResult(
-            code=code,
-            action=wait_action,
+            code=code_builder(params, locator),
+            action=partial(runner, driver, params, locator),
             capture_snapshot=False,
             wait_for_network=False
-        )
\ No newline at end of file
+        )
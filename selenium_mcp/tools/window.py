@@ -3,7 +3,7 @@
 import logging
 from pydantic import BaseModel, Field
 
-from ..tool_base import BaseTool, ToolSchema, ToolResult
+from ..tool_base import BaseTool, ToolSchema, ToolResult, run_in_thread
 from ..context import Context
 
 logger = logging.getLogger(__name__)
@@ -28,24 +28,24 @@ class ResizeTool(BaseTool):
         """Resize browser window."""
         driver = context.current_tab_or_die()
         
-        async def resize_action():
+        def resize_action():
             try:
                 driver.set_window_size(params.width, params.height)
-                logger.info(f"🪟 Resized window to {params.width}x{params.height}")
+                logger.info("🪟 Resized window to %sx%s", params.width, params.height)
                 return f"Window resized to {params.width}x{params.height}"
-            except Exception as e:
-                logger.error(f"Window resize failed: {e}")
+            except Exception:
+                logger.exception("Window resize failed")
                 raise
         
         # Robot Framework code
-        code = [
+        code = (
             f"# Resize window to {params.width}x{params.height}",
             f"Set Window Size    {params.width}    {params.height}"
-        ]
+        )
         
         return ToolResult(
             code=code,
-            action=resize_action,
+            action=run_in_thread(resize_action),
             capture_snapshot=True,
             wait_for_network=False
         )
\ No newline at end of file
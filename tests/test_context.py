@@ -0,0 +1,47 @@
+"""Tests for Context tool execution."""
+
+import asyncio
+import time
+
+from pydantic import BaseModel
+
+from selenium_mcp.context import Context
+from selenium_mcp.tool_base import BaseTool, ToolResult, ToolSchema, run_in_thread
+
+
+class SleepParams(BaseModel):
+    pass
+
+
+class SleepTool(BaseTool):
+    """Blocks in a worker thread like a WebDriver command and tracks overlap."""
+
+    def __init__(self):
+        super().__init__()
+        self.running = 0
+        self.max_running = 0
+
+    def _create_schema(self) -> ToolSchema:
+        return ToolSchema(name="sleep", description="Sleep", input_schema=SleepParams)
+
+    async def handle(self, context, params) -> ToolResult:
+        async def action():
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            await run_in_thread(lambda: time.sleep(0.05))()
+            self.running -= 1
+            return "slept"
+
+        return ToolResult(code=("# sleep",), action=action, capture_snapshot=False)
+
+
+def test_concurrent_tool_calls_run_one_at_a_time():
+    tool = SleepTool()
+    context = Context([tool])
+
+    async def run():
+        return await asyncio.gather(*(context.run_tool(tool, {}) for _ in range(3)))
+
+    results = asyncio.run(run())
+    assert [result["action_result"] for result in results] == ["slept"] * 3
+    assert tool.max_running == 1
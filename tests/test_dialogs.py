@@ -0,0 +1,75 @@
+"""Tests for the dialog_handle tool."""
+
+import asyncio
+from types import SimpleNamespace
+
+from selenium_mcp.tools.dialogs import ACCEPT_CODE, DISMISS_CODE, DialogParams, DialogTool
+
+
+class FakeAlert:
+    def __init__(self, text="Are you sure?"):
+        self.text = text
+        self.calls = []
+
+    def send_keys(self, keys):
+        self.calls.append(("send_keys", keys))
+
+    def accept(self):
+        self.calls.append(("accept",))
+
+    def dismiss(self):
+        self.calls.append(("dismiss",))
+
+
+class FakeDriver:
+    def __init__(self, alert):
+        self.switch_to = SimpleNamespace(alert=alert)
+
+    def execute_cdp_cmd(self, cmd, params):
+        raise AssertionError(f"dialogs must go through the WebDriver alert API, not {cmd}")
+
+
+class FakeContext:
+    """Just enough of Context for DialogTool.handle."""
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    def current_tab_or_die(self):
+        return self.driver
+
+
+def run_dialog(alert, **params):
+    async def run():
+        result = await DialogTool().handle(FakeContext(FakeDriver(alert)), DialogParams(**params))
+        return result, await result.action()
+    return asyncio.run(run())
+
+
+def test_accept_prompt_types_text_before_accepting():
+    alert = FakeAlert()
+    result, _ = run_dialog(alert, action="accept", text="Jane")
+    assert alert.calls == [("send_keys", "Jane"), ("accept",)]
+    assert result.code == (ACCEPT_CODE[0], "Input Text Into Alert    Jane", ACCEPT_CODE[1])
+
+
+def test_accept_without_text_only_accepts():
+    alert = FakeAlert()
+    result, _ = run_dialog(alert, action="accept")
+    assert alert.calls == [("accept",)]
+    assert result.code == ACCEPT_CODE
+
+
+def test_dismiss():
+    alert = FakeAlert()
+    result, _ = run_dialog(alert, action="dismiss")
+    assert alert.calls == [("dismiss",)]
+    assert result.code == DISMISS_CODE
+
+
+def test_get_text_reads_without_closing_and_skips_snapshot():
+    alert = FakeAlert("Delete item?")
+    result, text = run_dialog(alert, action="get_text")
+    assert text == "Delete item?"
+    assert alert.calls == []
+    assert result.capture_snapshot is False
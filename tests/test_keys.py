@@ -0,0 +1,66 @@
+"""Tests for the key_press tool."""
+
+import asyncio
+
+from selenium.webdriver.common.keys import Keys
+
+from selenium_mcp.tools.keys import KeyPressParams, KeyPressTool
+
+
+class FakeActionChains:
+    def __init__(self):
+        self.steps = []
+
+    def key_down(self, key):
+        self.steps.append(("down", key))
+        return self
+
+    def key_up(self, key):
+        self.steps.append(("up", key))
+        return self
+
+    def send_keys(self, keys):
+        self.steps.append(("send", keys))
+        return self
+
+    def perform(self):
+        self.steps.append(("perform",))
+
+
+class FakeContext:
+    def __init__(self):
+        self.chains = FakeActionChains()
+
+    def current_tab_or_die(self):
+        return object()
+
+    def action_chains(self, driver):
+        return self.chains
+
+
+def press(**params):
+    context = FakeContext()
+
+    async def run():
+        result = await KeyPressTool().handle(context, KeyPressParams(**params))
+        await result.action()
+        return result
+    return asyncio.run(run()), context.chains.steps
+
+
+def test_modifiers_are_released_in_the_order_given():
+    result, steps = press(key="Tab", modifiers=["ctrl", "Shift"])
+    assert steps == [
+        ("down", Keys.CONTROL),
+        ("down", Keys.SHIFT),
+        ("send", Keys.TAB),
+        ("up", Keys.CONTROL),
+        ("up", Keys.SHIFT),
+        ("perform",),
+    ]
+    assert result.code[1] == "Press Keys    None    ctrl+Shift+Tab"
+
+
+def test_unknown_modifiers_are_skipped_and_plain_keys_sent_as_is():
+    _, steps = press(key="a", modifiers=["hyper"])
+    assert steps == [("send", "a"), ("perform",)]
@@ -0,0 +1,137 @@
+"""Tests for the take_screenshot tool."""
+
+import asyncio
+import base64
+
+import pytest
+
+from selenium_mcp.tools.screenshot import JPEG_QUALITY, ScreenshotParams, ScreenshotTool
+
+IMAGE = b"\x89PNG\r\n\x1a\nnot really an image"
+
+
+class FakeDriver:
+    """A non-Chromium driver with only the WebDriver screenshot endpoints."""
+
+    def __init__(self):
+        self.commands = []
+
+    def save_screenshot(self, filename):
+        self.commands.append(("save_screenshot", filename))
+
+
+class FakeFullPageDriver(FakeDriver):
+    """A driver with a full-page screenshot endpoint but no CDP, like Firefox."""
+
+    def save_full_page_screenshot(self, filename):
+        self.commands.append(("save_full_page_screenshot", filename))
+
+
+class FakeCdpDriver(FakeDriver):
+    """A Chromium driver answering the Page domain commands."""
+
+    def __init__(self, metrics=None):
+        super().__init__()
+        self.metrics = metrics
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.commands.append((cmd, params))
+        if cmd == "Page.getLayoutMetrics":
+            return self.metrics
+        if cmd == "Page.captureScreenshot":
+            return {"data": base64.b64encode(IMAGE).decode()}
+        raise AssertionError(f"unexpected CDP command {cmd}")
+
+
+class FakeContext:
+    def __init__(self, driver):
+        self.driver = driver
+
+    async def ensure_browser(self):
+        return self.driver
+
+
+def take_screenshot(driver, **params):
+    async def run():
+        result = await ScreenshotTool().handle(FakeContext(driver), ScreenshotParams(**params))
+        await result.action()
+    asyncio.run(run())
+
+
+def test_cdp_capture_writes_decoded_png(tmp_path):
+    path = tmp_path / "page.png"
+    driver = FakeCdpDriver()
+    take_screenshot(driver, filename=str(path))
+    assert driver.commands == [("Page.captureScreenshot", {"format": "png", "optimizeForSpeed": True})]
+    assert path.read_bytes() == IMAGE
+
+
+@pytest.mark.parametrize("name", ["page.jpg", "page.JPEG"])
+def test_cdp_capture_uses_jpeg_for_jpeg_filenames(tmp_path, name):
+    path = tmp_path / name
+    driver = FakeCdpDriver()
+    take_screenshot(driver, filename=str(path))
+    assert driver.commands == [
+        ("Page.captureScreenshot", {"format": "jpeg", "quality": JPEG_QUALITY, "optimizeForSpeed": True})
+    ]
+    assert path.read_bytes() == IMAGE
+
+
+def test_without_cdp_uses_save_screenshot(tmp_path):
+    path = str(tmp_path / "page.png")
+    driver = FakeDriver()
+    take_screenshot(driver, filename=path)
+    assert driver.commands == [("save_screenshot", path)]
+
+
+@pytest.mark.parametrize(
+    "metrics",
+    [
+        {"cssContentSize": {"width": 1280, "height": 4000}, "contentSize": {"width": 2560, "height": 8000}},
+        {"contentSize": {"width": 1280, "height": 4000}},
+    ],
+    ids=["cssContentSize", "contentSize"],
+)
+def test_full_page_cdp_capture_clips_to_content_size(tmp_path, metrics):
+    path = tmp_path / "page.png"
+    driver = FakeCdpDriver(metrics)
+    take_screenshot(driver, filename=str(path), full_page=True)
+    assert driver.commands == [
+        ("Page.getLayoutMetrics", {}),
+        ("Page.captureScreenshot", {
+            "format": "png",
+            "optimizeForSpeed": True,
+            "captureBeyondViewport": True,
+            "clip": {"x": 0, "y": 0, "width": 1280, "height": 4000, "scale": 1},
+        }),
+    ]
+    assert path.read_bytes() == IMAGE
+
+
+def test_full_page_jpeg_keeps_quality(tmp_path):
+    driver = FakeCdpDriver({"cssContentSize": {"width": 800, "height": 600}})
+    take_screenshot(driver, filename=str(tmp_path / "page.jpg"), full_page=True)
+    capture_params = driver.commands[-1][1]
+    assert (capture_params["format"], capture_params["quality"]) == ("jpeg", JPEG_QUALITY)
+    assert capture_params["clip"]["height"] == 600
+
+
+def test_full_page_without_cdp_uses_save_full_page_screenshot(tmp_path):
+    path = str(tmp_path / "page.png")
+    driver = FakeFullPageDriver()
+    take_screenshot(driver, filename=path, full_page=True)
+    assert driver.commands == [("save_full_page_screenshot", path)]
+
+
+def test_viewport_without_cdp_ignores_full_page_endpoint(tmp_path):
+    path = str(tmp_path / "page.png")
+    driver = FakeFullPageDriver()
+    take_screenshot(driver, filename=path)
+    assert driver.commands == [("save_screenshot", path)]
+
+
+def test_full_page_without_any_full_page_support_saves_viewport(tmp_path):
+    path = str(tmp_path / "page.png")
+    driver = FakeDriver()
+    take_screenshot(driver, filename=path, full_page=True)
+    assert driver.commands == [("save_screenshot", path)]
@@ -0,0 +1,33 @@
+"""Tests for value escaping in the script generator."""
+
+import ast
+
+import pytest
+
+from selenium_mcp.tools.script_generator import render_action
+
+TRICKY_TEXT = 'She said "hi"\\now\nnext line'
+
+
+@pytest.mark.parametrize("tool,params,key", [
+    ("navigate_to", {"url": 'https://example.com/?q="x"'}, "url"),
+    ("input_text", {"element_ref": "e1", "text": TRICKY_TEXT}, "text"),
+    ("take_screenshot", {"filename": 'shot "1".png'}, "filename"),
+])
+def test_python_string_literals_round_trip(tool, params, key):
+    line = render_action("selenium_python", {"tool": tool, "params": params})
+    constants = {node.value for node in ast.walk(ast.parse(line)) if isinstance(node, ast.Constant)}
+    assert params[key] in constants
+
+
+@pytest.mark.parametrize("language", ["playwright", "webdriverio", "selenium_java", "selenium_js"])
+def test_quotes_and_newlines_are_escaped_in_other_languages(language):
+    line = render_action(language, {"tool": "input_text", "params": {"element_ref": "e1", "text": TRICKY_TEXT}})
+    assert '\\"hi\\"' in line
+    assert "\\\\now" in line
+    assert "\n" not in line
+
+
+def test_robot_framework_keeps_quotes_and_escapes_newlines():
+    line = render_action("robot_framework", {"tool": "input_text", "params": {"element_ref": "e1", "text": TRICKY_TEXT}})
+    assert line.endswith('She said "hi"\\\\now\\nnext line')
@@ -0,0 +1,73 @@
+"""Tests for value escaping in the improved script generator."""
+
+import ast
+import asyncio
+
+import pytest
+
+from selenium_mcp.tools.script_generator_improved import GenerateScriptParams, ImprovedGenerateScriptTool
+
+QUOTED_URL = "https://example.com/?q=\"it's\""
+QUOTED_TEXT = "He said \"hi\" and it's fine"
+QUOTED_FILENAME = "shot \"1\".png"
+BACKSLASH_URL = "https://example.com/search?q=C:\\temp\\new"
+MULTILINE_TEXT = "first line\nsecond\r\nthird \\n not a newline"
+WINDOWS_FILENAME = "C:\\shots\\today\\r1.png"
+
+
+class FakeContext:
+    """Just enough of Context for ImprovedGenerateScriptTool.handle."""
+
+    def __init__(self, actions):
+        self.action_history = actions
+        self.current_snapshot = None
+
+
+def generate(actions, format_name="pytest") -> str:
+    params = GenerateScriptParams(format=format_name)
+    result = asyncio.run(ImprovedGenerateScriptTool().handle(FakeContext(actions), params))
+    return result.code[-1]
+
+
+def string_constants(script: str) -> set:
+    return {node.value for node in ast.walk(ast.parse(script)) if isinstance(node, ast.Constant)}
+
+
+@pytest.mark.parametrize("format_name", ["pytest", "unittest", "selenium_python"])
+def test_quoted_values_produce_valid_python(format_name):
+    script = generate([
+        {"tool": "navigate_to", "params": {"url": QUOTED_URL}},
+        {"tool": "input_text", "params": {"element": "Comment box", "text": QUOTED_TEXT}},
+        {"tool": "take_screenshot", "params": {"filename": QUOTED_FILENAME}},
+    ], format_name)
+
+    # Each value survives as the exact string literal it was recorded as
+    constants = string_constants(script)
+    assert QUOTED_URL in constants
+    assert QUOTED_TEXT in constants
+    assert QUOTED_FILENAME in constants
+
+
+def test_quoted_verify_text_produces_valid_python():
+    script = generate([{"tool": "browser_verify_text_visible", "params": {"text": QUOTED_TEXT}}])
+    ast.parse(script)
+
+
+@pytest.mark.parametrize("format_name", ["pytest", "unittest", "selenium_python"])
+def test_backslashes_and_line_breaks_produce_valid_python(format_name):
+    script = generate([
+        {"tool": "navigate_to", "params": {"url": BACKSLASH_URL}},
+        {"tool": "input_text", "params": {"element": "Comment box", "text": MULTILINE_TEXT}},
+        {"tool": "take_screenshot", "params": {"filename": WINDOWS_FILENAME}},
+    ], format_name)
+
+    constants = string_constants(script)
+    assert BACKSLASH_URL in constants
+    assert MULTILINE_TEXT in constants
+    assert WINDOWS_FILENAME in constants
+
+
+def test_multiline_verify_text_produces_valid_python():
+    script = generate([{"tool": "browser_verify_text_visible", "params": {"text": MULTILINE_TEXT}}])
+    xpath = "//*[contains(text(), '" + MULTILINE_TEXT + "')]"
+    assert xpath in string_constants(script)
@@ -0,0 +1,65 @@
+"""Tests for server startup helpers."""
+
+import json
+
+import pytest
+from selenium.webdriver.remote import utils
+
+pytest.importorskip("fastmcp")
+pytest.importorskip("orjson")
+
+from selenium_mcp.server import install_fast_json_encoder
+
+ELEMENT = {"element-6066-11e4-a52f-4d65726c656d656e": "f.1C3D.d.7A2B.e.12"}
+
+# Command bodies as RemoteConnection.execute hands them to dump_json
+PAYLOADS = [
+    {"url": "https://example.com/?q=café&x=\"1\""},
+    {"using": "xpath", "value": "//*[contains(text(), concat('It', \"'\", 's'))]"},
+    {"script": "return arguments[0].map(t => t + '\\n');", "args": [["Welcome", "✓ done", ""]]},
+    {"script": "arguments[0].scrollIntoView(arguments[1]);", "args": [ELEMENT, {"block": "center"}]},
+    {"text": "line 1\nline 2\ttab \U0001f600"},
+    {"actions": [{
+        "type": "key", "id": "key", "actions": [
+            {"type": "keyDown", "value": ""}, {"type": "keyUp", "value": ""},
+        ],
+    }, {
+        "type": "pointer", "id": "mouse", "parameters": {"pointerType": "mouse"}, "actions": [
+            {"type": "pointerMove", "duration": 250, "x": 0, "y": -12.5, "origin": ELEMENT},
+            {"type": "pointerDown", "button": 0},
+        ],
+    }]},
+    {"cmd": "Page.captureScreenshot", "params": {
+        "format": "jpeg", "quality": 80, "optimizeForSpeed": True, "captureBeyondViewport": True,
+        "clip": {"x": 0, "y": 0, "width": 1280.5, "height": 4000, "scale": 1},
+    }},
+    {"handle": None, "timeouts": {"implicit": 0, "pageLoad": 300000, "script": 30000}},
+    {},
+]
+
+
+@pytest.fixture
+def fast_dump_json(monkeypatch):
+    """Install the encoder and restore Selenium's own dump_json afterwards."""
+    stdlib_dump_json = utils.dump_json
+    monkeypatch.setattr(utils, "dump_json", stdlib_dump_json)
+    assert install_fast_json_encoder()
+    assert utils.dump_json is not stdlib_dump_json
+    return utils.dump_json, stdlib_dump_json
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_fast_encoder_round_trips_command_bodies(fast_dump_json, payload):
+    dump_json, stdlib_dump_json = fast_dump_json
+    assert json.loads(dump_json(payload)) == payload
+    assert json.loads(dump_json(payload)) == json.loads(stdlib_dump_json(payload))
+
+
+def test_fast_encoder_falls_back_for_payloads_orjson_rejects(fast_dump_json):
+    dump_json, stdlib_dump_json = fast_dump_json
+    for payload in ({1: "int key"}, {"big": 2 ** 70}):
+        assert dump_json(payload) == stdlib_dump_json(payload)
+
+
+def test_importing_server_leaves_selenium_encoder_alone():
+    assert utils.dump_json.__module__ == utils.__name__
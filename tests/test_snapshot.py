@@ -0,0 +1,174 @@
+"""Tests for the snapshot and element interaction tools."""
+
+import asyncio
+import logging
+import re
+
+import pytest
+from pydantic import ValidationError
+
+from selenium_mcp.context import ElementInfo, PageSnapshot
+from selenium_mcp.tools.snapshot import SelectParams, SelectTool, SnapshotParams, SnapshotTool, render_snapshot_yaml
+
+
+def make_snapshot(count: int) -> PageSnapshot:
+    elements = {
+        f"e{i}": ElementInfo(ref=f"e{i}", tag_name="button", text=f"Button {i}", is_clickable=True)
+        for i in range(1, count + 1)
+    }
+    return PageSnapshot(elements=elements, url="https://example.com", title="Example")
+
+
+class FakeContext:
+    """Just enough of Context for SnapshotTool.handle."""
+
+    def __init__(self, snapshot: PageSnapshot):
+        self.current_snapshot = snapshot
+
+    async def ensure_browser(self):
+        return object()
+
+    async def capture_snapshot(self):
+        return self.current_snapshot
+
+
+def run_capture(snapshot: PageSnapshot, **params) -> str:
+    async def run():
+        result = await SnapshotTool().handle(FakeContext(snapshot), SnapshotParams(**params))
+        return await result.action()
+    return asyncio.run(run())["snapshot"]
+
+
+def test_max_elements_defaults_to_all():
+    assert SnapshotParams().max_elements is None
+
+
+@pytest.mark.parametrize("value", [0, -1])
+def test_max_elements_must_be_positive(value):
+    with pytest.raises(ValidationError):
+        SnapshotParams(max_elements=value)
+
+
+def test_render_lists_every_element_by_default():
+    yaml = render_snapshot_yaml(make_snapshot(3))
+    assert '- button "Button 3" [ref=e3]' in yaml
+    assert "omitted" not in yaml
+
+
+def test_render_truncates_and_reports_omitted_elements():
+    yaml = render_snapshot_yaml(make_snapshot(5), max_elements=2)
+    assert "[ref=e2]" in yaml
+    assert "[ref=e3]" not in yaml
+    assert "# ... 3 more elements omitted" in yaml
+
+
+def test_truncated_capture_is_not_cached():
+    snapshot = make_snapshot(5)
+    truncated = run_capture(snapshot, max_elements=2)
+    assert "# ... 3 more elements omitted" in truncated
+    assert snapshot.yaml_cache is None
+    # Truncated elements stay addressable by ref
+    assert snapshot.ref_locator("e5")
+
+    full = run_capture(snapshot)
+    assert "[ref=e5]" in full
+    assert snapshot.yaml_cache == full
+
+
+def test_max_elements_at_or_above_count_renders_full_snapshot():
+    snapshot = make_snapshot(3)
+    assert run_capture(snapshot, max_elements=3) == render_snapshot_yaml(snapshot)
+
+
+class FakeOption:
+    def __init__(self, text, value, enabled=True):
+        self.text = text
+        self.value = value
+        self.enabled = enabled
+        self.clicked = False
+
+    def is_selected(self):
+        return self.clicked
+
+    def is_enabled(self):
+        return self.enabled
+
+    def value_of_css_property(self, name):
+        return {"visibility": "visible", "display": "block", "opacity": "1"}[name]
+
+    def click(self):
+        self.clicked = True
+
+
+class FakeSelectElement:
+    """A <select> (or other tag) answering the lookups Selenium's Select makes."""
+
+    def __init__(self, tag_name="select", options=()):
+        self.tag_name = tag_name
+        self.options = list(options)
+        self.clicked = False
+
+    def get_dom_attribute(self, name):
+        return None
+
+    def find_elements(self, by, selector):
+        wanted = re.findall(r"[\"']([^\"']*)[\"']", selector)[-1]
+        attribute = "text" if by == "xpath" else "value"
+        return [option for option in self.options if getattr(option, attribute) == wanted]
+
+    def click(self):
+        self.clicked = True
+
+
+class SelectContext:
+    """Just enough of Context for SelectTool.handle."""
+
+    def __init__(self, element):
+        self.snapshot = PageSnapshot(elements={
+            "e1": ElementInfo(ref="e1", tag_name="select", attributes={"id": "country"}, web_element=element)
+        })
+
+    def current_tab_or_die(self):
+        return object()
+
+    def snapshot_or_die(self):
+        return self.snapshot
+
+
+def run_select(element, values):
+    async def run():
+        params = SelectParams(element="Country", ref="e1", values=values)
+        result = await SelectTool().handle(SelectContext(element), params)
+        await result.action()
+    asyncio.run(run())
+
+
+def test_select_picks_option_by_label_then_by_value():
+    options = [FakeOption("Netherlands", "nl"), FakeOption("Belgium", "be")]
+    run_select(FakeSelectElement(options=options), ["Belgium"])
+    assert [option.clicked for option in options] == [False, True]
+
+    options = [FakeOption("Netherlands", "nl"), FakeOption("Belgium", "be")]
+    run_select(FakeSelectElement(options=options), ["nl"])
+    assert [option.clicked for option in options] == [True, False]
+
+
+def test_select_refuses_disabled_option():
+    options = [FakeOption("Netherlands", "nl", enabled=False)]
+    with pytest.raises(NotImplementedError):
+        run_select(FakeSelectElement(options=options), ["Netherlands"])
+    assert not options[0].clicked
+
+
+def test_select_clicks_non_select_element():
+    element = FakeSelectElement(tag_name="div")
+    run_select(element, ["Anything"])
+    assert element.clicked
+
+
+def test_select_without_matching_option_warns_and_selects_nothing(caplog):
+    options = [FakeOption("Netherlands", "nl")]
+    with caplog.at_level(logging.WARNING, logger="selenium_mcp.tools.snapshot"):
+        run_select(FakeSelectElement(options=options), ["France", "fr"])
+    assert not options[0].clicked
+    assert "No option matching ['France', 'fr'] in Country" in caplog.text
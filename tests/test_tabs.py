@@ -0,0 +1,136 @@
+"""Tests for the tab management tools."""
+
+import asyncio
+
+import pytest
+from selenium.common.exceptions import NoSuchWindowException, WebDriverException
+
+from selenium_mcp.tools.tabs import TabCloseParams, TabCloseTool, TabListParams, TabListTool
+
+
+class FakeSwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        if handle not in self.driver.pages:
+            raise NoSuchWindowException(f"no such window: {handle}")
+        self.driver.current_window_handle = handle
+
+
+class FakeTabsDriver:
+    """A non-Chromium driver tracking open pages by window handle."""
+
+    def __init__(self, pages, current):
+        self.pages = dict(pages)
+        self.current_window_handle = current
+        self.switch_to = FakeSwitchTo(self)
+        self.commands = []
+
+    @property
+    def window_handles(self):
+        return list(self.pages)
+
+    @property
+    def title(self):
+        return self.pages[self.current_window_handle][0]
+
+    @property
+    def current_url(self):
+        return self.pages[self.current_window_handle][1]
+
+    def close(self):
+        self.commands.append(("close", self.current_window_handle))
+        del self.pages[self.current_window_handle]
+
+
+class FakeChromeTabsDriver(FakeTabsDriver):
+    """A Chromium driver whose CDP Target commands act on the pages directly."""
+
+    def __init__(self, pages, current, close_error=None):
+        super().__init__(pages, current)
+        self.close_error = close_error
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.commands.append((cmd, params.get("targetId")))
+        if cmd == "Target.closeTarget":
+            del self.pages[params["targetId"]]
+            if self.close_error:
+                raise self.close_error
+            return {"success": True}
+        if cmd == "Target.getTargets":
+            # Chromium reports the URL as the title of an untitled page
+            return {"targetInfos": [
+                {"targetId": handle, "type": "page", "title": title or url, "url": url}
+                for handle, (title, url) in self.pages.items()
+            ]}
+        raise AssertionError(f"unexpected CDP command {cmd}")
+
+
+PAGES = {"A": ("Home", "https://example.com/"), "B": ("Docs", "https://example.com/docs")}
+
+
+class FakeContext:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def current_tab_or_die(self):
+        return self.driver
+
+    async def ensure_browser(self):
+        return self.driver
+
+
+def run(tool, params, driver):
+    async def go():
+        result = await tool.handle(FakeContext(driver), params)
+        return await result.action()
+    return asyncio.run(go())
+
+
+def test_close_current_tab_uses_webdriver_and_switches_to_remaining():
+    driver = FakeChromeTabsDriver(PAGES, current="A")
+    run(TabCloseTool(), TabCloseParams(tab_id=0), driver)
+    assert driver.commands == [("close", "A")]
+    assert driver.window_handles == ["B"]
+    assert driver.current_window_handle == "B"
+
+
+def test_close_other_tab_uses_cdp_without_switching():
+    driver = FakeChromeTabsDriver(PAGES, current="A")
+    run(TabCloseTool(), TabCloseParams(tab_id=1), driver)
+    assert driver.commands == [("Target.closeTarget", "B")]
+    assert driver.current_window_handle == "A"
+
+
+def test_close_other_tab_without_cdp_switches_back():
+    driver = FakeTabsDriver(PAGES, current="A")
+    run(TabCloseTool(), TabCloseParams(tab_id=1), driver)
+    assert driver.commands == [("close", "B")]
+    assert driver.window_handles == ["A"]
+    assert driver.current_window_handle == "A"
+
+
+def test_cdp_error_after_tab_closed_does_not_fall_back():
+    driver = FakeChromeTabsDriver(PAGES, current="A", close_error=WebDriverException("target closed"))
+    run(TabCloseTool(), TabCloseParams(tab_id=1), driver)
+    assert driver.commands == [("Target.closeTarget", "B")]
+    assert driver.current_window_handle == "A"
+
+
+def test_close_unknown_tab_raises():
+    driver = FakeChromeTabsDriver(PAGES, current="A")
+    with pytest.raises(ValueError, match="Tab ID 5 not found"):
+        run(TabCloseTool(), TabCloseParams(tab_id=5), driver)
+
+
+def test_list_reports_same_titles_with_and_without_cdp():
+    pages = dict(PAGES, C=("", "https://example.com/untitled"), D=("", "about:blank"))
+    cdp_driver = FakeChromeTabsDriver(pages, current="B")
+    listed = run(TabListTool(), TabListParams(), cdp_driver)
+    assert cdp_driver.commands == [("Target.getTargets", None)]
+
+    switching_driver = FakeTabsDriver(pages, current="B")
+    assert run(TabListTool(), TabListParams(), switching_driver) == listed
+    assert switching_driver.current_window_handle == "B"
+    assert listed.splitlines()[2] == "Tab 2:  - https://example.com/untitled "
@@ -0,0 +1,151 @@
+"""Tests for the text verification helpers."""
+
+import json
+import re
+import shutil
+import subprocess
+
+import pytest
+from selenium.webdriver.common.by import By
+
+from selenium_mcp.tools.verification import TEXT_VISIBILITY_JS, TEXTS_VISIBLE_JS, text_visible, xpath_literal
+
+# (text, width, height, display, visibility, opacity)
+PAGE = (
+    ("Welcome back", 200, 20, "block", "visible", "1"),
+    ("Hidden banner", 200, 20, "block", "hidden", "1"),
+    ("Faded banner", 200, 20, "block", "visible", "0"),
+    ("Collapsed menu", 0, 0, "none", "visible", "1"),
+    ("Empty box", 0, 20, "block", "visible", "1"),
+    ("Shared label", 200, 20, "block", "hidden", "1"),
+    ("Shared label", 200, 20, "block", "visible", "1"),
+    ("It's \"quoted\"", 200, 20, "block", "visible", "1"),
+)
+
+TEXTS = ["Welcome", "Hidden", "Faded", "Collapsed", "Empty", "Shared", "It's \"quoted\"", "banner", "Missing"]
+
+
+def decode_literal(literal: str) -> str:
+    """Read back an XPath 1.0 string literal or concat() of literals."""
+    if literal.startswith("concat("):
+        return "".join(part[1:-1] for part in re.findall(r"'[^']*'|\"[^\"]*\"", literal[len("concat("):-1]))
+    return literal[1:-1]
+
+
+def expression_text(expression: str) -> str:
+    match = re.fullmatch(r"//\*\[contains\(text\(\), (.*)\)\]", expression)
+    assert match, expression
+    return decode_literal(match.group(1))
+
+
+class FakeElement:
+    """Displayed the way WebElement.is_displayed() judges it."""
+
+    def __init__(self, text, width, height, display, visibility, opacity):
+        self.text = text
+        self.size = (width, height)
+        self.style = (display, visibility, opacity)
+
+    def is_displayed(self):
+        display, visibility, opacity = self.style
+        return min(self.size) > 0 and display != "none" and visibility != "hidden" and opacity != "0"
+
+
+class FakeDriver:
+    def __init__(self, page):
+        self.elements = [FakeElement(*element) for element in page]
+        self.expressions = []
+
+    def find_elements(self, by, expression):
+        assert by == By.XPATH
+        self.expressions.append(expression)
+        text = expression_text(expression)
+        return [element for element in self.elements if text in element.text]
+
+
+# Runs a verification script in node against the same page, with a document
+# that resolves the XPath expressions the script builds
+NODE_HARNESS = r"""
+const {script, page, texts, checkVisibility} = JSON.parse(require("fs").readFileSync(0, "utf8"));
+const expressions = [];
+const decode = literal => literal.startsWith("concat(")
+    ? literal.slice(7, -1).match(/'[^']*'|"[^"]*"/g).map(part => part.slice(1, -1)).join("")
+    : literal.slice(1, -1);
+const elements = page.map(([text, width, height, display, visibility, opacity]) => {
+    const element = {text, style: {display, visibility, opacity}};
+    element.getBoundingClientRect = () => ({width, height});
+    if (checkVisibility) {
+        element.checkVisibility = options => display !== "none"
+            && !(options.visibilityProperty && visibility === "hidden")
+            && !(options.opacityProperty && opacity === "0");
+    }
+    return element;
+});
+global.XPathResult = {ORDERED_NODE_SNAPSHOT_TYPE: 7};
+global.getComputedStyle = element => element.style;
+global.document = {
+    evaluate(expression) {
+        expressions.push(expression);
+        const text = decode(expression.match(/^\/\/\*\[contains\(text\(\), (.*)\)\]$/)[1]);
+        const found = elements.filter(element => element.text.includes(text));
+        return {snapshotLength: found.length, snapshotItem: i => found[i]};
+    },
+};
+const result = new Function(script)(texts);
+process.stdout.write(JSON.stringify({result, expressions}));
+"""
+
+
+def run_in_node(script, texts, check_visibility=True):
+    payload = json.dumps({"script": script, "page": PAGE, "texts": texts, "checkVisibility": check_visibility})
+    output = subprocess.run(
+        ["node", "-e", NODE_HARNESS], input=payload, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output)
+
+
+def fallback_results(texts):
+    driver = FakeDriver(PAGE)
+    return [text_visible(driver, text) for text in texts], driver.expressions
+
+
+@pytest.mark.parametrize(
+    ("text", "literal"),
+    [
+        ("Welcome", "'Welcome'"),
+        ("It's here", "\"It's here\""),
+        ("Say \"hi\"", "'Say \"hi\"'"),
+        ("It's \"quoted\"", "concat('It', \"'\", 's \"quoted\"')"),
+        ("'", "\"'\""),
+        ("", "''"),
+    ],
+)
+def test_xpath_literal(text, literal):
+    assert xpath_literal(text) == literal
+    assert decode_literal(literal) == text
+
+
+def test_xpath_literal_with_both_quotes_at_the_edges():
+    text = "'both\" ends'"
+    assert xpath_literal(text) == "concat('', \"'\", 'both\" ends', \"'\", '')"
+    assert decode_literal(xpath_literal(text)) == text
+
+
+def test_fallback_matches_is_displayed():
+    visible, _ = fallback_results(TEXTS)
+    assert visible == [True, False, False, False, False, True, True, False, False]
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node is not installed")
+@pytest.mark.parametrize("check_visibility", [True, False], ids=["checkVisibility", "computed-style"])
+def test_batched_scripts_agree_with_fallback(check_visibility):
+    expected, expressions = fallback_results(TEXTS)
+
+    batched = run_in_node(TEXTS_VISIBLE_JS, TEXTS, check_visibility)
+    assert batched["result"] == expected
+    # The in-browser quoting builds the same expressions as xpath_literal
+    assert batched["expressions"] == expressions
+
+    counts = run_in_node(TEXT_VISIBILITY_JS, TEXTS, check_visibility)["result"]
+    assert [count["visible"] > 0 for count in counts] == expected
+    assert [count["total"] for count in counts] == [1, 1, 1, 1, 1, 2, 1, 2, 0]
@@ -0,0 +1,75 @@
+"""Tests for the wait_for tool."""
+
+import asyncio
+
+import pytest
+from pydantic import ValidationError
+
+from selenium_mcp.tools import wait
+from selenium_mcp.tools.wait import WaitParams, WaitTool
+
+
+class FakeSnapshot:
+    def ref_locator(self, ref):
+        return ("css selector", f"#{ref}")
+
+
+class FakeContext:
+    """Just enough of Context for WaitTool.handle."""
+
+    def __init__(self):
+        self.driver = object()
+
+    def current_tab_or_die(self):
+        return self.driver
+
+    def snapshot_or_die(self):
+        return FakeSnapshot()
+
+
+def handle(**params):
+    return asyncio.run(WaitTool().handle(FakeContext(), WaitParams(**params)))
+
+
+def test_poll_interval_defaults_to_100ms():
+    assert WaitParams(condition="page_load").poll_interval == 0.1
+
+
+@pytest.mark.parametrize("value", [0, -0.5])
+def test_poll_interval_must_be_positive(value):
+    with pytest.raises(ValidationError):
+        WaitParams(condition="page_load", poll_interval=value)
+
+
+def test_element_wait_polls_at_poll_interval(monkeypatch):
+    created = {}
+
+    class RecordingWait:
+        def __init__(self, driver, timeout, poll_frequency):
+            created.update(timeout=timeout, poll_frequency=poll_frequency)
+
+        def until(self, condition):
+            return True
+
+    monkeypatch.setattr(wait, "WebDriverWait", RecordingWait)
+    result = handle(condition="element_visible", ref="e1", element="Submit", timeout=3, poll_interval=0.25)
+    asyncio.run(result.action())
+    assert created == {"timeout": 3, "poll_frequency": 0.25}
+
+
+def test_page_load_code_uses_poll_interval():
+    result = handle(condition="page_load", timeout=5, poll_interval=0.5)
+    assert "Wait Until Keyword Succeeds    5.0s    0.5s" in result.code[1]
+
+
+def test_unknown_condition_raises_value_error():
+    with pytest.raises(ValueError, match="Invalid wait condition: sideways"):
+        handle(condition="sideways")
+
+
+@pytest.mark.parametrize("condition", ["element_visible", "element_hidden"])
+def test_element_condition_without_ref_raises_value_error(condition):
+    result = handle(condition=condition)
+    assert result.code[1] == "# Note: Element reference required"
+    with pytest.raises(ValueError, match=f"Element reference required for {condition} condition"):
+        asyncio.run(result.action())